@@ -1,6 +1,8 @@
 """Discord bot client for FlumphBot."""
 
 import logging
+import time
+from datetime import datetime
 
 import discord
 from discord.ext import commands
@@ -11,11 +13,14 @@ from flumphbot.calendar.event_analyzer import EventAnalyzer
 from flumphbot.calendar.google_client import GoogleCalendarClient
 from flumphbot.config import Config
 from flumphbot.scheduler.runner import SchedulerRunner
-from flumphbot.storage.base import StorageBackend
+from flumphbot.storage.base import PollRecord, StorageBackend, UserMapping
 from flumphbot.storage.sqlite import SQLiteStorage
 
 logger = logging.getLogger(__name__)
 
+# Seconds before the email index is rebuilt to pick up external mapping changes
+EMAIL_INDEX_TTL = 300.0
+
 
 class FlumphBot(commands.Bot):
     """Discord bot for D&D session scheduling."""
@@ -42,6 +47,8 @@ class FlumphBot(commands.Bot):
         self._event_analyzer: EventAnalyzer | None = None
         self._poll_manager: PollManager | None = None
         self._scheduler: SchedulerRunner | None = None
+        self._email_index: dict[str, UserMapping] | None = None
+        self._email_index_ts = 0.0
 
     @property
     def storage(self) -> StorageBackend:
@@ -87,6 +94,23 @@ class FlumphBot(commands.Bot):
             personal_keywords=personal_keywords,
         )
 
+    async def get_email_index(self) -> dict[str, UserMapping]:
+        """Get user mappings keyed by lowercased calendar email.
+
+        The index is built from a single storage call and cached for
+        EMAIL_INDEX_TTL seconds, so mapping changes made outside the bot
+        are picked up once it expires.
+
+        Returns:
+            Dictionary of calendar email to UserMapping.
+        """
+        now = time.monotonic()
+        if self._email_index is None or now - self._email_index_ts > EMAIL_INDEX_TTL:
+            mappings = await self.storage.get_all_user_mappings()
+            self._email_index = {m.calendar_email.lower(): m for m in mappings}
+            self._email_index_ts = now
+        return self._email_index
+
     async def reload_scheduler(self) -> None:
         """Reload scheduler with current settings from storage.
 
@@ -129,9 +153,24 @@ class FlumphBot(commands.Bot):
     def poll_manager(self) -> PollManager:
         """Get the poll manager."""
         if self._poll_manager is None:
-            self._poll_manager = PollManager(self.storage)
+            self._poll_manager = PollManager(
+                self.storage, on_poll_created=self._on_poll_created
+            )
         return self._poll_manager
 
+    def _on_poll_created(self, poll: PollRecord) -> None:
+        """Schedule the completion check for a newly created poll."""
+        self.schedule_poll_completion(poll.closes_at)
+
+    def schedule_poll_completion(self, run_at: datetime) -> None:
+        """Schedule the one-shot poll completion check, if the scheduler runs.
+
+        Args:
+            run_at: When to check the open poll (naive UTC).
+        """
+        if self._scheduler:
+            self._scheduler.schedule_poll_completion(run_at)
+
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
         logger.info("Setting up FlumphBot...")
@@ -173,6 +212,12 @@ class FlumphBot(commands.Bot):
         )
         await self.change_presence(activity=activity)
 
+        # Pick up any poll still open from a previous run. This waits for
+        # on_ready so an overdue check can already see the poll channel.
+        active_poll = await self.poll_manager.get_active_poll()
+        if active_poll:
+            self.schedule_poll_completion(active_poll.closes_at)
+
     async def on_poll_vote_add(
         self, poll: discord.Poll, user: discord.User, answer: discord.PollAnswer
     ) -> None:
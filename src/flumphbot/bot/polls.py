@@ -2,6 +2,7 @@
 
 import logging
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timedelta
 
 import discord
@@ -18,13 +19,21 @@ MAX_POLL_OPTIONS = 10
 class PollManager:
     """Manages D&D session scheduling polls."""
 
-    def __init__(self, storage: StorageBackend):
+    def __init__(
+        self,
+        storage: StorageBackend,
+        on_poll_created: Callable[[PollRecord], None] | None = None,
+    ):
         """Initialize the poll manager.
 
         Args:
             storage: Storage backend for poll persistence.
+            on_poll_created: Optional callback invoked with each new poll record.
         """
         self.storage = storage
+        self.on_poll_created = on_poll_created
+        # Whether storage holds an open poll; None until first checked
+        self.has_active_poll: bool | None = None
 
     async def create_scheduling_poll(
         self,
@@ -65,7 +74,7 @@ class PollManager:
             for event in away_events:
                 # Format the date range
                 if event.all_day:
-                    if (event.end - event.start).days > 1:
+                    if event.duration_days > 1:
                         date_str = f"{event.start.strftime('%b %d')}-{event.end.strftime('%b %d')}"
                     else:
                         date_str = event.start.strftime('%b %d')
@@ -103,12 +112,13 @@ class PollManager:
 
         # Store poll record
         poll_id = str(uuid.uuid4())
+        now = datetime.utcnow()
         poll_record = PollRecord(
             id=poll_id,
             message_id=message.id,
             channel_id=channel.id,
-            created_at=datetime.utcnow(),
-            closes_at=datetime.utcnow() + timedelta(hours=duration_hours),
+            created_at=now,
+            closes_at=now + timedelta(hours=duration_hours),
         )
 
         poll_options = [
@@ -117,8 +127,12 @@ class PollManager:
         ]
 
         await self.storage.create_poll(poll_record, poll_options)
+        self.has_active_poll = True
         logger.info(f"Created poll {poll_id} with {len(slots_to_use)} options")
 
+        if self.on_poll_created:
+            self.on_poll_created(poll_record)
+
         return message
 
     async def close_poll_and_get_winner(
@@ -144,29 +158,47 @@ class PollManager:
         max_votes = 0
         winning_date = None
 
+        tallies: list[tuple[datetime, int]] = []
+
         for i, answer in enumerate(message.poll.answers):
             if i < len(options):
                 vote_count = answer.vote_count
+                tallies.append((options[i].date, vote_count))
                 if vote_count > max_votes:
                     max_votes = vote_count
                     winning_date = options[i].date
 
+        # Record the final tallies in one batched write
+        if tallies:
+            await self.storage.bulk_update_option_votes(poll_record.id, tallies)
+
         if winning_date and max_votes > 0:
             # Update poll record
-            poll_record.closed = True
             poll_record.winning_date = winning_date
-            await self.storage.update_poll(poll_record)
+            await self.close_poll(poll_record)
             logger.info(f"Poll {poll_record.id} won by {winning_date} with {max_votes} votes")
 
         return winning_date
 
+    async def close_poll(self, poll_record: PollRecord) -> None:
+        """Mark a poll as closed in storage.
+
+        Args:
+            poll_record: The poll record to close.
+        """
+        poll_record.closed = True
+        await self.storage.update_poll(poll_record)
+        self.has_active_poll = False
+
     async def get_active_poll(self) -> PollRecord | None:
         """Get the currently active poll.
 
         Returns:
             The active poll record, or None.
         """
-        return await self.storage.get_active_poll()
+        poll = await self.storage.get_active_poll()
+        self.has_active_poll = poll is not None
+        return poll
 
     def create_dnd_event(
         self,
@@ -2,7 +2,8 @@
 
 import logging
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -20,7 +21,7 @@ class EventCategory(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
     """Result of analyzing an event."""
 
@@ -28,10 +29,26 @@ class AnalysisResult:
     should_be_free: bool
     is_personal: bool
     is_dnd_session: bool
-    matched_keywords: list[str]
+    matched_keywords: tuple[str, ...]
     category: EventCategory = EventCategory.OTHER
 
 
+@dataclass(slots=True)
+class ClassifiedEvents:
+    """Events grouped by every analysis, produced in a single pass."""
+
+    needs_fix: list[CalendarEvent] = field(default_factory=list)
+    personal: list[AnalysisResult] = field(default_factory=list)
+    away: list[CalendarEvent] = field(default_factory=list)
+    available_dates: list[AvailabilitySlot] = field(default_factory=list)
+    categories: dict[str, EventCategory] = field(default_factory=dict)
+
+    @property
+    def vacations(self) -> list[CalendarEvent]:
+        """Vacation events (same as away events)."""
+        return self.away
+
+
 class EventAnalyzer:
     """Analyzes calendar events for hygiene and personal content detection."""
 
@@ -85,6 +102,16 @@ class EventAnalyzer:
         self.away_keywords = away_keywords or self.DEFAULT_AWAY_KEYWORDS
         self.personal_keywords = personal_keywords or self.DEFAULT_PERSONAL_KEYWORDS
 
+        # Lowercased once so substring checks don't re-lower per event
+        self._dnd_lower: tuple[str, ...] = tuple(kw.lower() for kw in self.dnd_keywords)
+        self._away_lower: tuple[str, ...] = tuple(kw.lower() for kw in self.away_keywords)
+
+        # Use word boundary matching for more accurate personal detection
+        self._personal_patterns: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+            (kw, re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE))
+            for kw in self.personal_keywords
+        )
+
     def is_dnd_session(self, event: CalendarEvent) -> bool:
         """Check if an event is a D&D session.
 
@@ -94,8 +121,8 @@ class EventAnalyzer:
         Returns:
             True if this appears to be a D&D session.
         """
-        title = event.summary.lower()
-        return any(kw.lower() in title for kw in self.dnd_keywords)
+        title = event.summary_lower
+        return any(kw in title for kw in self._dnd_lower)
 
     def is_away_event(self, event: CalendarEvent) -> bool:
         """Check if an event is an away time / vacation event.
@@ -106,8 +133,8 @@ class EventAnalyzer:
         Returns:
             True if this appears to be an away time event.
         """
-        title = event.summary.lower()
-        return any(kw.lower() in title for kw in self.away_keywords)
+        title = event.summary_lower
+        return any(kw in title for kw in self._away_lower)
 
     def get_category(self, event: CalendarEvent) -> EventCategory:
         """Determine the category of an event.
@@ -118,19 +145,7 @@ class EventAnalyzer:
         Returns:
             The EventCategory for this event.
         """
-        # D&D takes priority
-        if self.is_dnd_session(event):
-            return EventCategory.DND
-
-        # Check for away time
-        if self.is_away_event(event):
-            return EventCategory.AWAY
-
-        # Check for personal events
-        if self.detect_personal_keywords(event):
-            return EventCategory.PERSONAL
-
-        return EventCategory.OTHER
+        return self.analyze_event(event).category
 
     def should_be_free(self, event: CalendarEvent) -> bool:
         """Determine if an event should be marked as Free.
@@ -156,16 +171,8 @@ class EventAnalyzer:
         Returns:
             List of matched personal keywords.
         """
-        text = f"{event.summary} {event.description or ''}".lower()
-        matched = []
-
-        for keyword in self.personal_keywords:
-            # Use word boundary matching for more accurate detection
-            pattern = rf"\b{re.escape(keyword)}\b"
-            if re.search(pattern, text, re.IGNORECASE):
-                matched.append(keyword)
-
-        return matched
+        text = event.text_lower
+        return [kw for kw, pattern in self._personal_patterns if pattern.search(text)]
 
     def analyze_event(self, event: CalendarEvent) -> AnalysisResult:
         """Perform full analysis of an event.
@@ -177,25 +184,98 @@ class EventAnalyzer:
             AnalysisResult with all findings.
         """
         is_dnd = self.is_dnd_session(event)
+        is_away = not is_dnd and self.is_away_event(event)
+        return self._build_result(event, is_dnd, is_away)
+
+    def _build_result(
+        self, event: CalendarEvent, is_dnd: bool, is_away: bool
+    ) -> AnalysisResult:
+        """Build an AnalysisResult from precomputed keyword checks."""
         matched_keywords = self.detect_personal_keywords(event)
-        category = self.get_category(event)
+
+        # D&D takes priority, then away time, then personal events
+        if is_dnd:
+            category = EventCategory.DND
+        elif is_away:
+            category = EventCategory.AWAY
+        elif matched_keywords:
+            category = EventCategory.PERSONAL
+        else:
+            category = EventCategory.OTHER
 
         return AnalysisResult(
             event=event,
-            should_be_free=self.should_be_free(event),
+            should_be_free=not is_dnd,
             is_personal=len(matched_keywords) > 0,
             is_dnd_session=is_dnd,
-            matched_keywords=matched_keywords,
+            matched_keywords=tuple(matched_keywords),
             category=category,
         )
 
+    def classify_all(
+        self,
+        events: Iterable[CalendarEvent],
+        start_date: datetime | None = None,
+        days_ahead: int = 14,
+        preferred_day: str | None = None,
+        personal: bool = True,
+    ) -> ClassifiedEvents:
+        """Classify events for every analysis in a single pass.
+
+        Equivalent to calling find_events_needing_fix(), find_personal_events(),
+        find_away_events() and find_available_dates() on the same events, and
+        get_category() on each of them. Groups the caller does not ask for
+        are skipped rather than computed and discarded.
+
+        Args:
+            events: Events to classify.
+            start_date: Starting date for the availability search. If None,
+                available_dates is left empty.
+            days_ahead: Number of days to look ahead for availability.
+            preferred_day: Preferred day of week (e.g., "Saturday").
+            personal: Whether to run personal keyword detection. If False,
+                personal and categories are left empty.
+
+        Returns:
+            ClassifiedEvents with the requested groups populated.
+        """
+        classified = ClassifiedEvents()
+        blocked_dates: set[datetime] = set()
+
+        for event in events:
+            is_dnd = self.is_dnd_session(event)
+            is_away = self.is_away_event(event)
+
+            if not is_dnd and event.status == EventStatus.BUSY:
+                classified.needs_fix.append(event)
+            if is_away or (event.all_day and event.duration_days > 1):
+                classified.away.append(event)
+
+            if personal:
+                result = self._build_result(event, is_dnd, is_away and not is_dnd)
+                classified.categories[event.id] = result.category
+                if result.is_personal:
+                    classified.personal.append(result)
+
+            if start_date is not None:
+                blocked_dates.add(
+                    event.start.replace(hour=0, minute=0, second=0, microsecond=0)
+                )
+
+        if start_date is not None:
+            classified.available_dates = self._open_dates(
+                blocked_dates, start_date, days_ahead, preferred_day
+            )
+
+        return classified
+
     def find_events_needing_fix(
-        self, events: list[CalendarEvent]
+        self, events: Iterable[CalendarEvent]
     ) -> list[CalendarEvent]:
         """Find events that need their status fixed.
 
         Args:
-            events: List of events to check.
+            events: Events to check.
 
         Returns:
             List of events that should be Free but are currently Busy.
@@ -208,11 +288,11 @@ class EventAnalyzer:
 
         return needs_fix
 
-    def find_personal_events(self, events: list[CalendarEvent]) -> list[AnalysisResult]:
+    def find_personal_events(self, events: Iterable[CalendarEvent]) -> list[AnalysisResult]:
         """Find events that appear to be personal.
 
         Args:
-            events: List of events to check.
+            events: Events to check.
 
         Returns:
             List of AnalysisResult for events with personal keywords.
@@ -228,7 +308,7 @@ class EventAnalyzer:
 
     def find_available_dates(
         self,
-        events: list[CalendarEvent],
+        events: Iterable[CalendarEvent],
         start_date: datetime,
         days_ahead: int = 14,
         preferred_day: str | None = None,
@@ -236,7 +316,7 @@ class EventAnalyzer:
         """Find dates without conflicting events.
 
         Args:
-            events: List of existing events.
+            events: Existing events.
             start_date: Starting date for search.
             days_ahead: Number of days to look ahead.
             preferred_day: Preferred day of week (e.g., "Saturday").
@@ -253,33 +333,56 @@ class EventAnalyzer:
             event_date = event.start.replace(hour=0, minute=0, second=0, microsecond=0)
             blocked_dates.add(event_date)
 
+        return self._open_dates(blocked_dates, start_date, days_ahead, preferred_day)
+
+    def _open_dates(
+        self,
+        blocked_dates: set[datetime],
+        start_date: datetime,
+        days_ahead: int,
+        preferred_day: str | None,
+    ) -> list[AvailabilitySlot]:
+        """List dates after start_date that are not in blocked_dates."""
         # Find available dates
         available: list[AvailabilitySlot] = []
-        current = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        for _ in range(days_ahead):
-            current += timedelta(days=1)
+        today = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        first = today + timedelta(days=1)
+        step = timedelta(days=1)
+        count = days_ahead
+
+        # If preferred day is set, start at its first occurrence and step
+        # a week at a time instead of checking every day
+        if preferred_day:
+            preferred = preferred_day.lower()
+            for offset in range(1, min(days_ahead, 7) + 1):
+                candidate = today + timedelta(days=offset)
+                if candidate.strftime("%A").lower() == preferred:
+                    first = candidate
+                    step = timedelta(weeks=1)
+                    count = (days_ahead - offset) // 7 + 1
+                    break
+            else:
+                return available
+
+        for i in range(count):
+            current = first + step * i
 
             # Skip if date is blocked
             if current in blocked_dates:
                 continue
 
-            # If preferred day is set, filter to only that day
-            if preferred_day and current.strftime("%A").lower() != preferred_day.lower():
-                continue
-
             available.append(AvailabilitySlot(date=current))
 
         return available
 
     def find_away_events(
         self,
-        events: list[CalendarEvent],
+        events: Iterable[CalendarEvent],
     ) -> list[CalendarEvent]:
         """Find events that are away time / vacations.
 
         Args:
-            events: List of events to check.
+            events: Events to check.
 
         Returns:
             List of away/vacation-related events.
@@ -289,14 +392,14 @@ class EventAnalyzer:
             if self.is_away_event(event):
                 away_events.append(event)
             # Also include multi-day all-day events as potential away time
-            elif event.all_day and (event.end - event.start).days > 1:
+            elif event.all_day and event.duration_days > 1:
                 away_events.append(event)
 
         return away_events
 
     def find_vacation_events(
         self,
-        events: list[CalendarEvent],
+        events: Iterable[CalendarEvent],
         vacation_keywords: list[str] | None = None,
     ) -> list[CalendarEvent]:
         """Find events that appear to be vacations or time off.
@@ -304,7 +407,7 @@ class EventAnalyzer:
         Deprecated: Use find_away_events() instead.
 
         Args:
-            events: List of events to check.
+            events: Events to check.
             vacation_keywords: Ignored, uses away_keywords from config.
 
         Returns:
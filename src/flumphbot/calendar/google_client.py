@@ -1,7 +1,11 @@
 """Google Calendar API client."""
 
+import asyncio
 import logging
+import threading
+from collections.abc import Iterator
 from datetime import datetime, timedelta
+from itertools import islice
 
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
@@ -25,59 +29,112 @@ class GoogleCalendarClient:
             config: Google configuration with credentials and calendar ID.
         """
         self.calendar_id = config.calendar_id
-        self._service = None
         self._credentials = config.credentials
+        # httplib2 is not thread-safe, so each thread gets its own service
+        self._local = threading.local()
 
     def _get_service(self):
-        """Get or create the Google Calendar service."""
-        if self._service is None:
+        """Get or create the Google Calendar service for the current thread."""
+        service = getattr(self._local, "service", None)
+        if service is None:
             credentials = service_account.Credentials.from_service_account_info(
                 self._credentials, scopes=SCOPES
             )
-            self._service = build("calendar", "v3", credentials=credentials)
-        return self._service
+            service = build("calendar", "v3", credentials=credentials)
+            self._local.service = service
+        return service
 
-    def get_events(
+    def iter_events(
         self,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-        max_results: int = 100,
-    ) -> list[CalendarEvent]:
-        """Fetch events from the calendar.
+        page_size: int = 100,
+    ) -> Iterator[CalendarEvent]:
+        """Lazily stream events from the calendar, following result pages.
 
         Args:
             start_date: Start of time range (defaults to now).
             end_date: End of time range (defaults to 2 weeks from now).
-            max_results: Maximum number of events to return.
+            page_size: Number of events to request per API page.
 
-        Returns:
-            List of CalendarEvent objects.
+        Yields:
+            CalendarEvent objects in start-time order.
         """
         if start_date is None:
             start_date = datetime.utcnow()
         if end_date is None:
             end_date = start_date + timedelta(weeks=2)
 
+        page_token = None
         try:
             service = self._get_service()
-            events_result = (
-                service.events()
-                .list(
-                    calendarId=self.calendar_id,
-                    timeMin=start_date.isoformat() + "Z",
-                    timeMax=end_date.isoformat() + "Z",
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy="startTime",
+            while True:
+                events_result = (
+                    service.events()
+                    .list(
+                        calendarId=self.calendar_id,
+                        timeMin=start_date.isoformat() + "Z",
+                        timeMax=end_date.isoformat() + "Z",
+                        maxResults=page_size,
+                        singleEvents=True,
+                        orderBy="startTime",
+                        pageToken=page_token,
+                    )
+                    .execute()
                 )
-                .execute()
-            )
-            events = events_result.get("items", [])
-            return [CalendarEvent.from_google_event(e) for e in events]
+                for e in events_result.get("items", []):
+                    yield CalendarEvent.from_google_event(e)
+
+                page_token = events_result.get("nextPageToken")
+                if not page_token:
+                    return
         except HttpError as e:
             logger.error(f"Error fetching calendar events: {e}")
             raise
 
+    def get_events(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        max_results: int = 100,
+    ) -> list[CalendarEvent]:
+        """Fetch events from the calendar.
+
+        Args:
+            start_date: Start of time range (defaults to now).
+            end_date: End of time range (defaults to 2 weeks from now).
+            max_results: Maximum number of events to return.
+
+        Returns:
+            List of CalendarEvent objects.
+        """
+        return list(
+            islice(
+                self.iter_events(start_date, end_date, page_size=max_results),
+                max_results,
+            )
+        )
+
+    async def get_events_async(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[CalendarEvent]:
+        """Fetch every event in a window without blocking the event loop.
+
+        Unlike get_events(), all result pages are followed, so busy windows
+        are not cut off at a fixed number of events.
+
+        Args:
+            start_date: Start of time range (defaults to now).
+            end_date: End of time range (defaults to 2 weeks from now).
+
+        Returns:
+            List of CalendarEvent objects.
+        """
+        # The generator does no work until list() drains it in the worker
+        return await asyncio.to_thread(list, self.iter_events(start_date, end_date))
+
     def create_event(self, event: CalendarEvent) -> CalendarEvent:
         """Create a new event on the calendar.
 
@@ -100,6 +157,17 @@ class GoogleCalendarClient:
             logger.error(f"Error creating event: {e}")
             raise
 
+    async def create_event_async(self, event: CalendarEvent) -> CalendarEvent:
+        """Create a new event without blocking the event loop.
+
+        Args:
+            event: The event to create.
+
+        Returns:
+            The created event with ID populated.
+        """
+        return await asyncio.to_thread(self.create_event, event)
+
     def update_event_status(self, event_id: str, status: EventStatus) -> CalendarEvent:
         """Update an event's busy/free status.
 
@@ -134,6 +202,20 @@ class GoogleCalendarClient:
             logger.error(f"Error updating event status: {e}")
             raise
 
+    async def update_event_status_async(
+        self, event_id: str, status: EventStatus
+    ) -> CalendarEvent:
+        """Update an event's busy/free status without blocking the event loop.
+
+        Args:
+            event_id: The ID of the event to update.
+            status: The new status (BUSY or FREE).
+
+        Returns:
+            The updated event.
+        """
+        return await asyncio.to_thread(self.update_event_status, event_id, status)
+
     def get_event(self, event_id: str) -> CalendarEvent:
         """Get a single event by ID.
 
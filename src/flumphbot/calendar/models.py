@@ -1,9 +1,17 @@
 """Data models for calendar events."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+
+    def _parse_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 string, accepting a trailing 'Z' on Python 3.10."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class EventStatus(Enum):
     """Calendar event busy/free status."""
@@ -12,7 +20,7 @@ class EventStatus(Enum):
     FREE = "transparent"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CalendarEvent:
     """Represents a Google Calendar event."""
 
@@ -24,6 +32,18 @@ class CalendarEvent:
     creator_email: str | None = None
     description: str | None = None
     all_day: bool = False
+    # Derived values used by event analysis, computed once per event
+    summary_lower: str = field(init=False, repr=False, compare=False)
+    text_lower: str = field(init=False, repr=False, compare=False)
+    duration_days: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute lowercase text and duration in whole days."""
+        summary_lower = self.summary.lower()
+        description_lower = self.description.lower() if self.description else ""
+        object.__setattr__(self, "summary_lower", summary_lower)
+        object.__setattr__(self, "text_lower", f"{summary_lower} {description_lower}")
+        object.__setattr__(self, "duration_days", (self.end - self.start).days)
 
     @classmethod
     def from_google_event(cls, event: dict) -> "CalendarEvent":
@@ -34,17 +54,13 @@ class CalendarEvent:
 
         if "date" in start_data:
             # All-day event
-            start = datetime.fromisoformat(start_data["date"])
-            end = datetime.fromisoformat(end_data["date"])
+            start = _parse_datetime(start_data["date"])
+            end = _parse_datetime(end_data["date"])
             all_day = True
         else:
             # Timed event
-            start = datetime.fromisoformat(
-                start_data.get("dateTime", "").replace("Z", "+00:00")
-            )
-            end = datetime.fromisoformat(
-                end_data.get("dateTime", "").replace("Z", "+00:00")
-            )
+            start = _parse_datetime(start_data.get("dateTime", ""))
+            end = _parse_datetime(end_data.get("dateTime", ""))
             all_day = False
 
         # Parse transparency (busy/free status)
@@ -82,7 +98,7 @@ class CalendarEvent:
         return event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AvailabilitySlot:
     """Represents a time slot when all players are available."""
 
@@ -1,13 +1,15 @@
 """Scheduler runner using APScheduler for local/generic deployments."""
 
 import logging
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from flumphbot.scheduler.tasks import ScheduledTasks
+from flumphbot.scheduler.tasks import ScheduledTasks, _utcnow
 
 if TYPE_CHECKING:
     from flumphbot.bot.client import FlumphBot
@@ -25,6 +27,14 @@ DAY_MAP = {
     "sunday": "sun",
 }
 
+# Collapse missed runs into one, never overlap a job with itself, and drop
+# runs that are more than a minute late (e.g. after an outage)
+JOB_DEFAULTS = {
+    "coalesce": True,
+    "max_instances": 1,
+    "misfire_grace_time": 60,
+}
+
 
 class SchedulerRunner:
     """Runs scheduled tasks using APScheduler."""
@@ -37,7 +47,7 @@ class SchedulerRunner:
         """
         self.bot = bot
         self.tasks = ScheduledTasks(bot)
-        self.scheduler = AsyncIOScheduler()
+        self.scheduler = AsyncIOScheduler(job_defaults=JOB_DEFAULTS)
         self._setup_jobs()
 
     def _setup_jobs(self) -> None:
@@ -72,15 +82,20 @@ class SchedulerRunner:
             timezone: Timezone string.
             config: Scheduler config for other settings.
         """
-        # Weekly poll job
-        self.scheduler.add_job(
-            self.tasks.post_weekly_poll,
-            CronTrigger(
+
+        def make_cron(cron_hour: int) -> CronTrigger:
+            """Build a weekly trigger on the configured day, minute and timezone."""
+            return CronTrigger(
                 day_of_week=day_of_week,
-                hour=hour,
+                hour=cron_hour,
                 minute=minute,
                 timezone=timezone,
-            ),
+            )
+
+        # Weekly poll job
+        self.scheduler.add_job(
+            self.tasks.post_weekly_poll,
+            make_cron(hour),
             id="weekly_poll",
             name="Post weekly scheduling poll",
             replace_existing=True,
@@ -101,26 +116,11 @@ class SchedulerRunner:
             f"Scheduled calendar sync every {config.sync_interval_minutes} minutes"
         )
 
-        # Poll completion check (every 5 minutes)
-        self.scheduler.add_job(
-            self.tasks.check_poll_completion,
-            IntervalTrigger(minutes=5),
-            id="poll_completion",
-            name="Check poll completion",
-            replace_existing=True,
-        )
-        logger.info("Scheduled poll completion check every 5 minutes")
-
         # Vacation confirmation (weekly, 1 hour before poll)
         confirm_hour = hour - 1 if hour > 0 else 23
         self.scheduler.add_job(
             self.tasks.confirm_vacations,
-            CronTrigger(
-                day_of_week=day_of_week,
-                hour=confirm_hour,
-                minute=minute,
-                timezone=timezone,
-            ),
+            make_cron(confirm_hour),
             id="vacation_confirmation",
             name="Vacation confirmation requests",
             replace_existing=True,
@@ -149,6 +149,23 @@ class SchedulerRunner:
         )
         logger.info("Scheduled poll warning check every 30 minutes")
 
+    def schedule_poll_completion(self, closes_at: datetime) -> None:
+        """Schedule a one-shot poll completion check for when a poll closes.
+
+        Args:
+            closes_at: When the poll closes (naive UTC).
+        """
+        # A run date in the past would be dropped as a misfire, so run now
+        run_date = max(closes_at, _utcnow())
+        self.scheduler.add_job(
+            self.tasks.check_poll_completion,
+            DateTrigger(run_date=run_date, timezone="UTC"),
+            id="poll_completion",
+            name="Check poll completion",
+            replace_existing=True,
+        )
+        logger.info(f"Scheduled poll completion check for {run_date:%Y-%m-%d %H:%M} UTC")
+
     async def reload_schedule(self) -> None:
         """Reload schedule settings from storage.
 
@@ -1,20 +1,133 @@
 """Scheduled task definitions for FlumphBot."""
 
+import asyncio
+import calendar
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Awaitable, Iterable
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import discord
 
 from flumphbot.bot.polls import VacationConfirmationView
 from flumphbot.calendar.event_analyzer import EventCategory
-from flumphbot.calendar.models import EventStatus
+from flumphbot.calendar.models import CalendarEvent, EventStatus
+from flumphbot.storage.base import UserMapping
 
 if TYPE_CHECKING:
     from flumphbot.bot.client import FlumphBot
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of DMs sent at the same time
+MAX_CONCURRENT_DMS = 10
+
+# Maximum number of calendar event updates in flight at the same time
+MAX_CONCURRENT_UPDATES = 10
+
+# Discord's maximum message length in characters
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Delay before re-checking a poll that could not be closed yet
+POLL_COMPLETION_RETRY = timedelta(minutes=5)
+
+# Back-off in seconds for a rate-limited response without a Retry-After hint
+RATE_LIMIT_BACKOFF = 5.0
+
+# Month names resolved once; calendar.month_name calls strftime on every lookup
+_MONTH_NAMES = tuple(calendar.month_name)
+
+
+def _split_message(
+    header: str, lines: list[str], limit: int = DISCORD_MESSAGE_LIMIT
+) -> list[str]:
+    """Join lines under a header, starting a new message when one would overflow.
+
+    Args:
+        header: First line of every message.
+        lines: Lines to append; any line too long to fit is truncated.
+        limit: Maximum characters per message.
+
+    Returns:
+        One or more messages, each at most limit characters.
+    """
+    max_line = limit - len(header) - 1
+    messages = []
+    current = header
+    for line in lines:
+        line = line[:max_line]
+        if len(current) + 1 + len(line) > limit:
+            messages.append(current)
+            current = header
+        current += "\n" + line
+    messages.append(current)
+    return messages
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching stored poll times.
+
+    Calendar queries and poll records use naive UTC throughout, so the
+    aware value is stripped rather than mixed in; this also avoids the
+    deprecated datetime.utcnow().
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _rate_limit_delay(error: BaseException) -> float | None:
+    """Seconds to back off if an error is an HTTP 429, otherwise None.
+
+    Discord errors expose ``status`` and Azure's ``HttpResponseError`` exposes
+    ``status_code``; both are read by attribute so the optional Azure SDK is
+    not imported here.
+    """
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    if status != 429:
+        return None
+
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+    try:
+        return float(retry_after) if retry_after is not None else RATE_LIMIT_BACKOFF
+    except (TypeError, ValueError):
+        return RATE_LIMIT_BACKOFF
+
+
+def _first_rate_limit(results: Iterable[object]) -> BaseException | None:
+    """Return the first rate-limit error among gathered results, if any."""
+    for result in results:
+        if isinstance(result, BaseException) and _rate_limit_delay(result) is not None:
+            return result
+    return None
+
+
+async def _back_off(error: BaseException, task: str) -> bool:
+    """Sleep out a rate limit so the caller can re-raise it to the scheduler.
+
+    Args:
+        error: The exception caught by the task.
+        task: Task description for the log message.
+
+    Returns:
+        True if the error was a rate limit and the caller should re-raise.
+    """
+    delay = _rate_limit_delay(error)
+    if delay is None:
+        return False
+    logger.warning(f"Rate limited during {task}, backing off {delay:.1f}s")
+    await asyncio.sleep(delay)
+    return True
+
+
+def _format_day(date: datetime) -> str:
+    """Format a date like strftime('%B %d') without parsing a format string."""
+    return f"{_MONTH_NAMES[date.month]} {date.day:02d}"
+
 
 class ScheduledTasks:
     """Collection of scheduled tasks for FlumphBot."""
@@ -26,6 +139,9 @@ class ScheduledTasks:
             bot: The FlumphBot instance.
         """
         self.bot = bot
+        # Bounds concurrent DMs to stay within Discord's rate limits
+        self._dm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DMS)
+        self._update_semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
 
     async def post_weekly_poll(self) -> None:
         """Post the weekly scheduling poll.
@@ -34,6 +150,7 @@ class ScheduledTasks:
         It checks calendar availability and posts a poll for available dates.
         """
         logger.info("Running weekly poll task")
+        now = _utcnow()
 
         try:
             # Check for active poll
@@ -42,18 +159,26 @@ class ScheduledTasks:
                 logger.info("Active poll already exists, skipping")
                 return
 
+            # Get the notification channel before any calendar calls
+            channel = self.bot.get_channel(self.bot.config.discord.channel_id)
+            if not channel:
+                logger.error("Could not find notification channel")
+                return
+
             # Get events for the next 2 weeks
-            events = self.bot.calendar_client.get_events(
-                start_date=datetime.utcnow(),
-                end_date=datetime.utcnow() + timedelta(weeks=2),
+            events = await self.bot.calendar_client.get_events_async(
+                start_date=now,
+                end_date=now + timedelta(weeks=2),
             )
 
-            # Find available dates
-            available = self.bot.event_analyzer.find_available_dates(
+            # Classify events once for availability and away time
+            classified = self.bot.event_analyzer.classify_all(
                 events,
-                start_date=datetime.utcnow(),
+                start_date=now,
                 days_ahead=14,
+                personal=False,
             )
+            available = classified.available_dates
 
             if not available:
                 await self.bot.send_notification(
@@ -63,7 +188,7 @@ class ScheduledTasks:
                 return
 
             # Get away events to display in poll context
-            away_events = self.bot.event_analyzer.find_away_events(events)
+            away_events = classified.away
 
             # Load tag_everyone setting
             tag_everyone_setting = await self.bot.storage.get_setting("tag_everyone")
@@ -76,12 +201,6 @@ class ScheduledTasks:
             else:
                 duration_hours = self.bot.config.scheduler.poll_duration_hours
 
-            # Get the notification channel
-            channel = self.bot.get_channel(self.bot.config.discord.channel_id)
-            if not channel:
-                logger.error("Could not find notification channel")
-                return
-
             # Create the poll
             if isinstance(channel, discord.TextChannel):
                 await self.bot.poll_manager.create_scheduling_poll(
@@ -106,94 +225,139 @@ class ScheduledTasks:
         4. Detect personal events and alert users
         """
         logger.info("Running calendar hygiene sync")
+        now = _utcnow()
 
         try:
-            events = self.bot.calendar_client.get_events()
+            # Only recent and upcoming events matter for availability
+            events = await self.bot.calendar_client.get_events_async(
+                start_date=now - timedelta(days=1),
+                end_date=now + timedelta(weeks=4),
+            )
+            email_index = await self.bot.get_email_index()
 
-            # Find events needing status fix
-            needs_fix = self.bot.event_analyzer.find_events_needing_fix(events)
+            # Classify events once for status fixes and personal events
+            classified = self.bot.event_analyzer.classify_all(events)
+            needs_fix = classified.needs_fix
 
-            for event in needs_fix:
-                try:
-                    # Fix the status
-                    self.bot.calendar_client.update_event_status(
-                        event.id, EventStatus.FREE
+            # Fix all statuses concurrently
+            results = await asyncio.gather(
+                *(self._mark_free(event) for event in needs_fix),
+                return_exceptions=True,
+            )
+
+            # Queue notifications and send them together at the end
+            notifications: list[Awaitable[object]] = []
+            generic_fixes: list[str] = []
+
+            for event, result in zip(needs_fix, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Error fixing event {event.id}", exc_info=result
                     )
+                    continue
 
-                    # Determine event category for notification
-                    category = self.bot.event_analyzer.get_category(event)
+                logger.info(f"Fixed event {event.summary} to Free")
 
-                    if category == EventCategory.AWAY:
-                        # Special notification for Away Time events
-                        creator_name = event.creator_email or "Someone"
-                        if event.creator_email:
-                            mapping = await self._find_user_by_email(event.creator_email)
-                            if mapping:
-                                creator_name = mapping.discord_name
+                # Category was computed during classification
+                if classified.categories[event.id] == EventCategory.AWAY:
+                    # Special notification for Away Time events
+                    creator_name = event.creator_email or "Someone"
+                    if event.creator_email:
+                        mapping = self._lookup(event.creator_email, email_index)
+                        if mapping:
+                            creator_name = mapping.discord_name
 
-                        await self.bot.send_notification(
+                    notifications.append(
+                        self.bot.send_notification(
                             f"**{creator_name}** - You created an Away Time item "
                             f"(\"{event.summary}\") in the shared D&D calendar that was "
                             f"set to Busy. I automatically changed it to Free to not "
                             f"interfere with shared free/busy schedules."
                         )
-                    else:
-                        # Generic fix notification
-                        await self.bot.send_notification(
-                            f"Fixed '{event.summary}' to 'Free' status "
-                            f"(was incorrectly marked as 'Busy')"
-                        )
-
-                    logger.info(f"Fixed event {event.summary} to Free")
-
-                except Exception:
-                    logger.exception(f"Error fixing event {event.id}")
+                    )
+                else:
+                    generic_fixes.append(event.summary)
+
+            # Generic fixes go out as a digest, split to fit Discord's limit
+            if generic_fixes:
+                digests = _split_message(
+                    "Fixed the following to 'Free' status "
+                    "(were incorrectly marked as 'Busy'):",
+                    [f"- {summary}" for summary in generic_fixes],
+                )
+                notifications.extend(
+                    self.bot.send_notification(digest) for digest in digests
+                )
 
-            # Find personal events
-            personal = self.bot.event_analyzer.find_personal_events(events)
+            # Alert creators of personal events
+            personal = classified.personal
 
-            for result in personal:
+            for analysis in personal:
                 # Try to find the creator's Discord ID
-                if result.event.creator_email:
-                    mapping = await self._find_user_by_email(result.event.creator_email)
+                if analysis.event.creator_email:
+                    mapping = self._lookup(analysis.event.creator_email, email_index)
                     if mapping:
-                        await self._alert_personal_event(
-                            mapping.discord_id,
-                            result.event,
-                            result.matched_keywords,
+                        notifications.append(
+                            self._alert_personal_event(
+                                mapping.discord_id,
+                                analysis.event,
+                                analysis.matched_keywords,
+                            )
                         )
 
+            outcomes = await asyncio.gather(*notifications, return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    logger.error("Error sending calendar sync notification", exc_info=outcome)
+
             logger.info(
                 f"Calendar sync complete: fixed {len(needs_fix)}, "
                 f"found {len(personal)} personal events"
             )
 
-        except Exception:
+            # Surface rate limits so the next run waits instead of piling on
+            rate_limited = _first_rate_limit([*results, *outcomes])
+            if rate_limited is not None:
+                raise rate_limited
+
+        except Exception as e:
+            if await _back_off(e, "calendar hygiene sync"):
+                raise
             logger.exception("Error in calendar hygiene sync")
 
     async def check_poll_completion(self) -> None:
         """Check if active poll has completed and process results.
 
-        This task runs frequently to detect when polls close and
-        create the winning D&D session event.
+        This task runs as a one-shot job at the poll's close time and
+        creates the winning D&D session event. If the poll cannot be
+        closed yet, the check is scheduled again.
         """
+        # Skip the storage round-trip when no poll is known to be open
+        if self.bot.poll_manager.has_active_poll is False:
+            return
+
         logger.info("Checking poll completion")
+        now = _utcnow()
+        # Every exit that leaves the poll open re-arms the one-shot check
+        retry_at: datetime | None = now + POLL_COMPLETION_RETRY
 
         try:
             active_poll = await self.bot.poll_manager.get_active_poll()
             if not active_poll:
+                retry_at = None
                 return
 
             # Check if poll should be closed
-            if datetime.utcnow() < active_poll.closes_at:
+            if now < active_poll.closes_at:
+                retry_at = active_poll.closes_at
                 return
 
             # Get the poll message
             channel = self.bot.get_channel(active_poll.channel_id)
             if not channel:
+                logger.warning(f"Poll channel {active_poll.channel_id} not available yet")
                 return
 
-            import discord
             if isinstance(channel, discord.TextChannel):
                 try:
                     message = await channel.fetch_message(active_poll.message_id)
@@ -205,11 +369,16 @@ class ScheduledTasks:
                 winning_date = await self.bot.poll_manager.close_poll_and_get_winner(
                     active_poll, message
                 )
+                if not winning_date:
+                    # Nobody voted; close the record so the poll is not reopened
+                    await self.bot.poll_manager.close_poll(active_poll)
+                if active_poll.closed:
+                    retry_at = None
 
                 if winning_date:
                     # Create D&D session event
                     event = self.bot.poll_manager.create_dnd_event(winning_date)
-                    created = self.bot.calendar_client.create_event(event)
+                    created = await self.bot.calendar_client.create_event_async(event)
 
                     # Update poll record with event ID
                     active_poll.created_event_id = created.id
@@ -224,9 +393,16 @@ class ScheduledTasks:
                     await self.bot.send_notification(
                         "Poll closed but no votes were cast. No session scheduled."
                     )
+            else:
+                # Other channel types cannot hold the poll; retrying won't help
+                logger.error(f"Poll channel {active_poll.channel_id} is not a text channel")
+                retry_at = None
 
         except Exception:
             logger.exception("Error checking poll completion")
+        finally:
+            if retry_at is not None:
+                self.bot.schedule_poll_completion(retry_at)
 
     async def confirm_vacations(self) -> None:
         """Send vacation confirmation requests to users.
@@ -235,46 +411,61 @@ class ScheduledTasks:
         to confirm their upcoming vacation dates are still accurate.
         """
         logger.info("Running vacation confirmation")
+        now = _utcnow()
 
         try:
-            events = self.bot.calendar_client.get_events(
-                end_date=datetime.utcnow() + timedelta(weeks=4)
+            events = await self.bot.calendar_client.get_events_async(
+                start_date=now,
+                end_date=now + timedelta(weeks=4),
             )
 
             vacations = self.bot.event_analyzer.find_vacation_events(events)
+            if not vacations:
+                logger.info("No upcoming vacations to confirm")
+                return
 
             # Group vacations by creator
-            by_creator: dict = {}
+            by_creator: dict[str, list[CalendarEvent]] = {}
             for vacation in vacations:
                 email = vacation.creator_email
                 if email:
-                    if email not in by_creator:
-                        by_creator[email] = []
-                    by_creator[email].append(vacation)
-
-            # Send confirmation requests
-            for email, user_vacations in by_creator.items():
-                mapping = await self._find_user_by_email(email)
-                if mapping:
-                    await self._send_vacation_confirmation(
-                        mapping.discord_id, user_vacations
-                    )
+                    by_creator.setdefault(email, []).append(vacation)
+
+            # Send confirmation requests concurrently
+            email_index = await self.bot.get_email_index()
+            await asyncio.gather(
+                *(
+                    self._send_vacation_confirmation(mapping.discord_id, user_vacations)
+                    for email, user_vacations in by_creator.items()
+                    if (mapping := self._lookup(email, email_index))
+                ),
+                return_exceptions=True,
+            )
 
             logger.info(f"Sent vacation confirmations to {len(by_creator)} users")
 
         except Exception:
             logger.exception("Error in vacation confirmation")
 
-    async def _find_user_by_email(self, email: str):
-        """Find user mapping by calendar email."""
-        mappings = await self.bot.storage.get_all_user_mappings()
-        for mapping in mappings:
-            if mapping.calendar_email.lower() == email.lower():
-                return mapping
-        return None
+    @staticmethod
+    def _lookup(email: str, index: dict[str, UserMapping]) -> UserMapping | None:
+        """Find user mapping by calendar email in a prebuilt index."""
+        return index.get(email.lower())
+
+    async def _mark_free(self, event: CalendarEvent) -> CalendarEvent:
+        """Set an event to Free, bounded alongside other calendar updates."""
+        async with self._update_semaphore:
+            return await self.bot.calendar_client.update_event_status_async(
+                event.id, EventStatus.FREE
+            )
+
+    async def _send_reminder(self, discord_id: int, message: str) -> None:
+        """Send a session reminder DM to a user."""
+        async with self._dm_semaphore:
+            await self.bot.send_dm(discord_id, message)
 
     async def _alert_personal_event(
-        self, discord_id: int, event, keywords: list[str]
+        self, discord_id: int, event, keywords: tuple[str, ...]
     ) -> None:
         """Send personal event alert to a user."""
         keyword_str = ", ".join(keywords)
@@ -283,14 +474,15 @@ class ScheduledTasks:
             f"(Detected keywords: {keyword_str})\n\n"
             f"Did you mean to add this to the D&D calendar?"
         )
-        await self.bot.send_dm(discord_id, message)
+        async with self._dm_semaphore:
+            await self.bot.send_dm(discord_id, message)
 
     async def _send_vacation_confirmation(
         self, discord_id: int, vacations: list
     ) -> None:
         """Send vacation confirmation request to a user."""
         vacation_list = "\n".join(
-            f"- {v.summary}: {v.start.strftime('%B %d')} - {v.end.strftime('%B %d')}"
+            f"- {v.summary}: {_format_day(v.start)} - {_format_day(v.end)}"
             for v in vacations
         )
 
@@ -301,9 +493,10 @@ class ScheduledTasks:
         )
 
         try:
-            user = await self.bot.fetch_user(discord_id)
-            view = VacationConfirmationView(discord_id, vacations)
-            await user.send(message, view=view)
+            async with self._dm_semaphore:
+                user = await self.bot.fetch_user(discord_id)
+                view = VacationConfirmationView(discord_id, vacations)
+                await user.send(message, view=view)
         except Exception:
             logger.exception(f"Error sending vacation confirmation to {discord_id}")
 
@@ -314,22 +507,29 @@ class ScheduledTasks:
         reminder DMs to all registered users.
         """
         logger.info("Checking for session reminders")
+        now = _utcnow()
 
         try:
-            # Load reminder hours setting
-            reminder_hours = await self.bot.storage.get_setting("reminder_hours")
+            # Load reminder hours and user mappings together
+            reminder_hours, mappings = await asyncio.gather(
+                self.bot.storage.get_setting("reminder_hours"),
+                self.bot.storage.get_all_user_mappings(),
+            )
             if not reminder_hours or int(reminder_hours) == 0:
                 logger.debug("Session reminders disabled")
                 return
 
             hours = int(reminder_hours)
 
+            if not mappings:
+                logger.debug("No user mappings for reminders")
+                return
+
             # Get events for the reminder window
-            now = datetime.utcnow()
             window_start = now + timedelta(hours=hours - 0.5)  # -30 min tolerance
             window_end = now + timedelta(hours=hours + 0.5)    # +30 min tolerance
 
-            events = self.bot.calendar_client.get_events(
+            events = await self.bot.calendar_client.get_events_async(
                 start_date=window_start,
                 end_date=window_end,
             )
@@ -344,40 +544,47 @@ class ScheduledTasks:
                 logger.debug("No sessions in reminder window")
                 return
 
-            # Get all user mappings
-            mappings = await self.bot.storage.get_all_user_mappings()
-            if not mappings:
-                logger.debug("No user mappings for reminders")
+            # Check which sessions were already reminded in one read
+            sent = await self.bot.storage.get_sent_reminders(
+                [session.id for session in dnd_sessions]
+            )
+            pending = [session for session in dnd_sessions if session.id not in sent]
+            if not pending:
+                logger.debug("Reminders already sent for sessions in window")
                 return
 
-            # Send reminders for each session
-            for session in dnd_sessions:
-                # Check if we already sent reminder for this session
-                reminder_key = f"reminder_sent_{session.id}"
-                already_sent = await self.bot.storage.get_setting(reminder_key)
-                if already_sent:
-                    continue
-
-                # Format session time
+            # Queue every (user, session) DM into one batch, bounded by the
+            # shared DM semaphore
+            deliveries: list[tuple[int, str]] = []
+            for session in pending:
                 session_time = session.start.strftime("%A, %B %d at %I:%M %p")
+                message = (
+                    f"**Reminder:** D&D session starts in {hours} hours!\n"
+                    f"{session_time}"
+                )
+                deliveries.extend((mapping.discord_id, message) for mapping in mappings)
 
-                for mapping in mappings:
-                    try:
-                        message = (
-                            f"**Reminder:** D&D session starts in {hours} hours!\n"
-                            f"{session_time}"
-                        )
-                        await self.bot.send_dm(mapping.discord_id, message)
-                    except Exception:
-                        logger.exception(
-                            f"Error sending reminder to {mapping.discord_id}"
-                        )
+            results = await asyncio.gather(
+                *(self._send_reminder(discord_id, message) for discord_id, message in deliveries),
+                return_exceptions=True,
+            )
+            for (discord_id, _), result in zip(deliveries, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending reminder to {discord_id}", exc_info=result)
 
-                # Mark reminder as sent
-                await self.bot.storage.set_setting(reminder_key, "true")
+            # Mark reminders as sent
+            for session in pending:
+                await self.bot.storage.mark_reminder_sent(session.id)
                 logger.info(f"Sent reminders for session: {session.summary}")
 
-        except Exception:
+            # Sessions are already marked, so backing off never resends a DM
+            rate_limited = _first_rate_limit(results)
+            if rate_limited is not None:
+                raise rate_limited
+
+        except Exception as e:
+            if await _back_off(e, "session reminders task"):
+                raise
             logger.exception("Error in session reminders task")
 
     async def check_poll_warning(self) -> None:
@@ -386,18 +593,25 @@ class ScheduledTasks:
         This task runs hourly to check if an active poll is about to close
         with too few votes.
         """
+        # Skip the storage round-trips when no poll is known to be open
+        if self.bot.poll_manager.has_active_poll is False:
+            return
+
         logger.info("Checking for poll warning")
+        now = _utcnow()
 
         try:
-            # Load warning settings
-            pollwarn_hours = await self.bot.storage.get_setting("pollwarn_hours")
+            # Load both warning settings in one read
+            settings = await self.bot.storage.get_settings_bulk(
+                ["pollwarn_hours", "pollwarn_min_votes"]
+            )
+            pollwarn_hours = settings.get("pollwarn_hours")
             if not pollwarn_hours or int(pollwarn_hours) == 0:
                 logger.debug("Poll warnings disabled")
                 return
 
             hours = int(pollwarn_hours)
-            min_votes_setting = await self.bot.storage.get_setting("pollwarn_min_votes")
-            min_votes = int(min_votes_setting or "3")
+            min_votes = int(settings.get("pollwarn_min_votes") or "3")
 
             # Check for active poll
             active_poll = await self.bot.poll_manager.get_active_poll()
@@ -405,21 +619,18 @@ class ScheduledTasks:
                 logger.debug("No active poll")
                 return
 
+            # Check if we already sent warning for this poll
+            if active_poll.warning_sent:
+                logger.debug("Warning already sent for this poll")
+                return
+
             # Check if we're in the warning window
-            now = datetime.utcnow()
             warning_threshold = active_poll.closes_at - timedelta(hours=hours)
 
             if now < warning_threshold:
                 logger.debug("Not yet in warning window")
                 return
 
-            # Check if we already sent warning for this poll
-            warning_key = f"pollwarn_sent_{active_poll.id}"
-            already_sent = await self.bot.storage.get_setting(warning_key)
-            if already_sent:
-                logger.debug("Warning already sent for this poll")
-                return
-
             # Get the poll message to check votes
             channel = self.bot.get_channel(active_poll.channel_id)
             if not isinstance(channel, discord.TextChannel):
@@ -456,7 +667,8 @@ class ScheduledTasks:
             await channel.send(warning_message)
 
             # Mark warning as sent
-            await self.bot.storage.set_setting(warning_key, "true")
+            active_poll.warning_sent = True
+            await self.bot.storage.update_poll(active_poll)
             logger.info(f"Sent poll warning: {total_votes} votes")
 
         except Exception:
@@ -1,9 +1,12 @@
 """Azure Table Storage backend for cloud deployments."""
 
+import asyncio
 import contextlib
 import json
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from typing import Any
 
 from flumphbot.storage.base import (
     PollOption,
@@ -15,8 +18,12 @@ from flumphbot.storage.base import (
 logger = logging.getLogger(__name__)
 
 try:
+    import requests
     from azure.core.exceptions import ResourceNotFoundError
+    from azure.core.pipeline.transport import RequestsTransport
     from azure.data.tables import TableServiceClient
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
     AZURE_AVAILABLE = True
 except ImportError:
@@ -25,9 +32,52 @@ except ImportError:
         "azure-data-tables not installed. Install with: pip install azure-data-tables"
     )
 
+# Poll partitions: open polls are kept apart so the active lookup reads ~1 row
+ACTIVE_POLLS = "active"
+CLOSED_POLLS = "closed"
+# Partition used before polls were split by state; migrated on initialize
+LEGACY_POLLS = "polls"
+# Active RowKeys start with this minus the creation time in ms, so the
+# newest poll sorts first
+REVERSE_TICKS_BASE = 2**63
+
+# Settings-row prefixes that recorded sent flags before they had their own
+# table and poll property; migrated on initialize
+LEGACY_REMINDER_SENT = "reminder_sent_"
+LEGACY_POLLWARN_SENT = "pollwarn_sent_"
+
+# Seconds a setting (including a missing one) is served from memory
+SETTINGS_TTL = 30.0
+
+# Seconds the full user mapping list is served from memory
+USER_MAPPINGS_TTL = 60.0
+
+# Columns needed to build a UserMapping
+USER_MAPPING_COLUMNS = ["RowKey", "discord_name", "calendar_email", "created_at"]
+
+# Azure Tables accepts at most 100 operations per transaction
+MAX_BATCH_SIZE = 100
+
+# Pooled connections kept open to the table endpoint; sized for the worker
+# threads that run concurrent SDK calls
+HTTP_POOL_SIZE = 16
+
+TABLE_NAMES = [
+    "usermappings",
+    "polls",
+    "polloptions",
+    "settings",
+    "keywords",
+    "sentreminders",
+]
+
 
 class AzureTableStorage(StorageBackend):
-    """Azure Table Storage backend."""
+    """Azure Table Storage backend.
+
+    The azure-data-tables SDK is synchronous, so every network call is run
+    in a worker thread to keep the Discord event loop responsive.
+    """
 
     def __init__(self, connection_string: str):
         """Initialize the Azure Table Storage.
@@ -43,13 +93,35 @@ class AzureTableStorage(StorageBackend):
 
         self.connection_string = connection_string
         self._service_client: TableServiceClient | None = None
+        self._session: requests.Session | None = None
         self._tables: dict = {}
+        self._settings_cache: dict[str, tuple[float, str | None]] = {}
+        self._user_mappings_cache: tuple[float, list[UserMapping]] | None = None
+        # Polls known to be in the closed partition, so updates only delete
+        # the other partition's copy when a poll actually changes state
+        self._closed_polls: set[str] = set()
 
     def _get_service(self) -> TableServiceClient:
         """Get or create the table service client."""
         if self._service_client is None:
+            # One pooled session shared by every table client for the life of
+            # the process; the SDK pipeline does its own retries
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=len(TABLE_NAMES),
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            transport = RequestsTransport(
+                session=self._session,
+                session_owner=False,
+                connection_timeout=10,
+                read_timeout=30,
+            )
             self._service_client = TableServiceClient.from_connection_string(
-                self.connection_string
+                self.connection_string, transport=transport
             )
         return self._service_client
 
@@ -60,12 +132,55 @@ class AzureTableStorage(StorageBackend):
             self._tables[table_name] = service.get_table_client(table_name)
         return self._tables[table_name]
 
+    async def _get_entity(
+        self, table_name: str, partition_key: str, row_key: str
+    ) -> dict | None:
+        """Read one entity in a worker thread, or None if it doesn't exist."""
+        table = self._get_table(table_name)
+        try:
+            return await asyncio.to_thread(table.get_entity, partition_key, row_key)
+        except ResourceNotFoundError:
+            return None
+
+    async def _query(self, table_name: str, query_filter: str, **kwargs: Any) -> list[dict]:
+        """Run a query and read every page in a worker thread."""
+        table = self._get_table(table_name)
+        return await asyncio.to_thread(
+            lambda: list(table.query_entities(query_filter, **kwargs))
+        )
+
+    async def _query_first(
+        self, table_name: str, query_filter: str, **kwargs: Any
+    ) -> dict | None:
+        """Fetch only the first matching entity in a worker thread."""
+        table = self._get_table(table_name)
+        return await asyncio.to_thread(
+            lambda: next(
+                iter(table.query_entities(query_filter, results_per_page=1, **kwargs)),
+                None,
+            )
+        )
+
+    async def _upsert(self, table_name: str, entity: dict) -> None:
+        """Upsert one entity in a worker thread."""
+        await asyncio.to_thread(self._get_table(table_name).upsert_entity, entity)
+
+    async def _delete(self, table_name: str, partition_key: str, row_key: str) -> None:
+        """Delete one entity in a worker thread, ignoring missing ones."""
+        table = self._get_table(table_name)
+        with contextlib.suppress(ResourceNotFoundError):
+            await asyncio.to_thread(table.delete_entity, partition_key, row_key)
+
     async def initialize(self) -> None:
         """Create tables if they don't exist."""
+        await asyncio.to_thread(self._setup_tables)
+        logger.info("Azure Table Storage initialized")
+
+    def _setup_tables(self) -> None:
+        """Create tables, prepare their clients and migrate legacy rows."""
         service = self._get_service()
 
-        table_names = ["usermappings", "polls", "polloptions", "settings", "keywords"]
-        for table_name in table_names:
+        for table_name in TABLE_NAMES:
             try:
                 service.create_table(table_name)
                 logger.info(f"Created table: {table_name}")
@@ -73,7 +188,89 @@ class AzureTableStorage(StorageBackend):
                 # Table likely already exists
                 pass
 
-        logger.info("Azure Table Storage initialized")
+        # Build every table client now so the first task doesn't pay for it
+        for table_name in TABLE_NAMES:
+            self._get_table(table_name)
+
+        # Table clients share the service's transport; one read opens the
+        # pooled connection before the first scheduled task needs it
+        try:
+            next(iter(self._get_table("settings").list_entities(results_per_page=1)), None)
+        except Exception:
+            logger.debug("Azure Table Storage warmup query failed", exc_info=True)
+
+        self._migrate_polls()
+        self._migrate_sent_flags()
+
+    def _migrate_polls(self) -> None:
+        """Rewrite polls stored under older partition or RowKey layouts."""
+        table = self._get_table("polls")
+        for partition in (LEGACY_POLLS, ACTIVE_POLLS):
+            entities = list(
+                table.query_entities("PartitionKey eq @pk", parameters={"pk": partition})
+            )
+            for entity in entities:
+                # Current rows carry poll_id; older ones used it as RowKey
+                if "poll_id" in entity:
+                    continue
+                poll = self._entity_to_poll(entity)
+                table.upsert_entity(self._poll_to_entity(poll))
+                table.delete_entity(partition, entity["RowKey"])
+                logger.info(f"Migrated poll {poll.id} out of {partition} layout")
+
+    def _migrate_sent_flags(self) -> None:
+        """Move sent flags stored as settings rows to their current homes.
+
+        Reminders already sent become sentreminders rows and warned open polls
+        get warning_sent set, so upgrading does not send either twice. The
+        settings rows are deleted afterwards.
+        """
+        settings = self._get_table("settings")
+
+        def legacy_rows(prefix: str) -> list[dict]:
+            # RowKeys sort as strings, so a prefix is a half-open range
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            return list(
+                settings.query_entities(
+                    "PartitionKey eq @pk and RowKey ge @lo and RowKey lt @hi",
+                    parameters={"pk": "settings", "lo": prefix, "hi": upper},
+                )
+            )
+
+        reminders = legacy_rows(LEGACY_REMINDER_SENT)
+        sent_at = datetime.utcnow().isoformat()
+        for entity in reminders:
+            self._get_table("sentreminders").upsert_entity(
+                {
+                    "PartitionKey": "reminders",
+                    "RowKey": entity["RowKey"][len(LEGACY_REMINDER_SENT) :],
+                    "sent_at": sent_at,
+                }
+            )
+
+        warnings = legacy_rows(LEGACY_POLLWARN_SENT)
+        if warnings:
+            warned = {e["RowKey"][len(LEGACY_POLLWARN_SENT) :] for e in warnings}
+            polls = self._get_table("polls")
+            for poll in polls.query_entities(
+                "PartitionKey eq @pk", parameters={"pk": ACTIVE_POLLS}
+            ):
+                if poll["poll_id"] in warned and not poll.get("warning_sent"):
+                    polls.update_entity(
+                        {
+                            "PartitionKey": ACTIVE_POLLS,
+                            "RowKey": poll["RowKey"],
+                            "warning_sent": True,
+                        }
+                    )
+
+        for entity in reminders + warnings:
+            settings.delete_entity("settings", entity["RowKey"])
+        if reminders or warnings:
+            logger.info(
+                f"Migrated {len(reminders)} reminder and {len(warnings)} "
+                "poll warning flags out of settings"
+            )
 
     async def close(self) -> None:
         """Close the storage connection."""
@@ -81,25 +278,18 @@ class AzureTableStorage(StorageBackend):
             self._service_client.close()
             self._service_client = None
             self._tables.clear()
+        if self._session:
+            self._session.close()
+            self._session = None
 
     # User mappings
     async def get_user_mapping(self, discord_id: int) -> UserMapping | None:
         """Get a user mapping by Discord ID."""
-        table = self._get_table("usermappings")
-        try:
-            entity = table.get_entity("users", str(discord_id))
-            return UserMapping(
-                discord_id=int(entity["RowKey"]),
-                discord_name=entity["discord_name"],
-                calendar_email=entity["calendar_email"],
-                created_at=datetime.fromisoformat(entity["created_at"]),
-            )
-        except ResourceNotFoundError:
-            return None
+        entity = await self._get_entity("usermappings", "users", str(discord_id))
+        return self._entity_to_user_mapping(entity) if entity else None
 
     async def set_user_mapping(self, mapping: UserMapping) -> None:
         """Create or update a user mapping."""
-        table = self._get_table("usermappings")
         entity = {
             "PartitionKey": "users",
             "RowKey": str(mapping.discord_id),
@@ -107,80 +297,74 @@ class AzureTableStorage(StorageBackend):
             "calendar_email": mapping.calendar_email,
             "created_at": mapping.created_at.isoformat(),
         }
-        table.upsert_entity(entity)
+        await self._upsert("usermappings", entity)
+        self._user_mappings_cache = None
 
     async def get_all_user_mappings(self) -> list[UserMapping]:
-        """Get all user mappings."""
-        table = self._get_table("usermappings")
-        entities = table.query_entities("PartitionKey eq 'users'")
-        return [
-            UserMapping(
-                discord_id=int(e["RowKey"]),
-                discord_name=e["discord_name"],
-                calendar_email=e["calendar_email"],
-                created_at=datetime.fromisoformat(e["created_at"]),
-            )
-            for e in entities
-        ]
+        """Get all user mappings, served from a short-lived cache when fresh."""
+        now = time.monotonic()
+        if self._user_mappings_cache and now - self._user_mappings_cache[0] < USER_MAPPINGS_TTL:
+            return list(self._user_mappings_cache[1])
+
+        entities = await self._query(
+            "usermappings",
+            "PartitionKey eq @pk",
+            parameters={"pk": "users"},
+            select=USER_MAPPING_COLUMNS,
+            results_per_page=1000,
+        )
+        mappings = [self._entity_to_user_mapping(e) for e in entities]
+        self._user_mappings_cache = (now, mappings)
+        return list(mappings)
 
     async def delete_user_mapping(self, discord_id: int) -> None:
         """Delete a user mapping."""
-        table = self._get_table("usermappings")
-        with contextlib.suppress(ResourceNotFoundError):
-            table.delete_entity("users", str(discord_id))
+        await self._delete("usermappings", "users", str(discord_id))
+        self._user_mappings_cache = None
 
     # Poll management
     async def create_poll(self, poll: PollRecord, options: list[PollOption]) -> None:
         """Create a new poll with its options."""
-        polls_table = self._get_table("polls")
-        options_table = self._get_table("polloptions")
-
-        poll_entity = {
-            "PartitionKey": "polls",
-            "RowKey": poll.id,
-            "message_id": poll.message_id,
-            "channel_id": poll.channel_id,
-            "created_at": poll.created_at.isoformat(),
-            "closes_at": poll.closes_at.isoformat(),
-            "closed": poll.closed,
-            "winning_date": poll.winning_date.isoformat() if poll.winning_date else "",
-            "created_event_id": poll.created_event_id or "",
-        }
-        polls_table.upsert_entity(poll_entity)
-
-        for option in options:
-            option_entity = {
-                "PartitionKey": poll.id,
-                "RowKey": option.date.isoformat(),
-                "vote_count": option.vote_count,
-            }
-            options_table.upsert_entity(option_entity)
+        await self._upsert("polls", self._poll_to_entity(poll))
+        if poll.closed:
+            self._closed_polls.add(poll.id)
+
+        # Options share the poll's partition, so they can be written in batches
+        await self._upsert_options(
+            poll.id,
+            [(option.date, option.vote_count) for option in options],
+        )
 
     async def get_poll(self, poll_id: str) -> PollRecord | None:
         """Get a poll by ID."""
-        table = self._get_table("polls")
-        try:
-            entity = table.get_entity("polls", poll_id)
-            return self._entity_to_poll(entity)
-        except ResourceNotFoundError:
-            return None
+        entity = await self._get_entity("polls", CLOSED_POLLS, poll_id)
+        if entity is not None:
+            self._closed_polls.add(poll_id)
+        else:
+            # Active RowKeys are time-prefixed, so match on the ID column
+            entity = await self._query_first(
+                "polls",
+                "PartitionKey eq @pk and poll_id eq @poll_id",
+                parameters={"pk": ACTIVE_POLLS, "poll_id": poll_id},
+            )
+        return self._entity_to_poll(entity) if entity else None
 
     async def get_active_poll(self) -> PollRecord | None:
         """Get the currently active (not closed) poll."""
-        table = self._get_table("polls")
-        entities = table.query_entities(
-            "PartitionKey eq 'polls' and closed eq false"
+        # RowKeys sort newest first, so the first row is the most recent poll
+        entity = await self._query_first(
+            "polls", "PartitionKey eq @pk", parameters={"pk": ACTIVE_POLLS}
         )
-        polls = [self._entity_to_poll(e) for e in entities]
-        if polls:
-            # Return the most recent
-            return max(polls, key=lambda p: p.created_at)
-        return None
+        return self._entity_to_poll(entity) if entity else None
 
     async def get_poll_options(self, poll_id: str) -> list[PollOption]:
         """Get all options for a poll."""
-        table = self._get_table("polloptions")
-        entities = table.query_entities(f"PartitionKey eq '{poll_id}'")
+        entities = await self._query(
+            "polloptions",
+            "PartitionKey eq @pk",
+            parameters={"pk": poll_id},
+            select=["RowKey", "vote_count"],
+        )
         return [
             PollOption(
                 poll_id=poll_id,
@@ -192,56 +376,145 @@ class AzureTableStorage(StorageBackend):
 
     async def update_poll(self, poll: PollRecord) -> None:
         """Update a poll record."""
-        table = self._get_table("polls")
-        entity = {
-            "PartitionKey": "polls",
-            "RowKey": poll.id,
-            "message_id": poll.message_id,
-            "channel_id": poll.channel_id,
-            "created_at": poll.created_at.isoformat(),
-            "closes_at": poll.closes_at.isoformat(),
-            "closed": poll.closed,
-            "winning_date": poll.winning_date.isoformat() if poll.winning_date else "",
-            "created_event_id": poll.created_event_id or "",
-        }
-        table.upsert_entity(entity)
+        await self._upsert("polls", self._poll_to_entity(poll))
+
+        # Remove the copy left in the other partition when the state changes
+        if poll.closed and poll.id not in self._closed_polls:
+            await self._delete("polls", ACTIVE_POLLS, self._active_row_key(poll))
+            self._closed_polls.add(poll.id)
+        elif not poll.closed and poll.id in self._closed_polls:
+            await self._delete("polls", CLOSED_POLLS, poll.id)
+            self._closed_polls.discard(poll.id)
 
     async def update_option_votes(
         self, poll_id: str, date: datetime, votes: int
     ) -> None:
         """Update the vote count for a poll option."""
-        table = self._get_table("polloptions")
         entity = {
             "PartitionKey": poll_id,
             "RowKey": date.isoformat(),
             "vote_count": votes,
         }
-        table.upsert_entity(entity)
+        await self._upsert("polloptions", entity)
+
+    async def bulk_update_option_votes(
+        self, poll_id: str, updates: list[tuple[datetime, int]]
+    ) -> None:
+        """Update vote counts for several options in batched transactions."""
+        await self._upsert_options(poll_id, updates)
+
+    async def _upsert_options(
+        self, poll_id: str, updates: list[tuple[datetime, int]]
+    ) -> None:
+        """Upsert option entities for a poll, MAX_BATCH_SIZE per transaction."""
+        table = self._get_table("polloptions")
+        operations = [
+            (
+                "upsert",
+                {
+                    "PartitionKey": poll_id,
+                    "RowKey": date.isoformat(),
+                    "vote_count": votes,
+                },
+            )
+            for date, votes in updates
+        ]
+        for i in range(0, len(operations), MAX_BATCH_SIZE):
+            await asyncio.to_thread(
+                table.submit_transaction, operations[i : i + MAX_BATCH_SIZE]
+            )
 
     # Settings
     async def get_setting(self, key: str) -> str | None:
-        """Get a setting value."""
-        table = self._get_table("settings")
-        try:
-            entity = table.get_entity("settings", key)
-            return entity["value"]
-        except ResourceNotFoundError:
-            return None
+        """Get a setting value, served from a short-lived cache when fresh."""
+        now = time.monotonic()
+        cached = self._settings_cache.get(key)
+        if cached and now - cached[0] < SETTINGS_TTL:
+            return cached[1]
+
+        entity = await self._get_entity("settings", "settings", key)
+        value = entity["value"] if entity else None
+        # Missing keys are cached too; most *_sent_* flags are never set
+        self._settings_cache[key] = (now, value)
+        return value
+
+    async def get_settings_bulk(self, keys: list[str]) -> dict[str, str]:
+        """Get several settings, querying only the keys not freshly cached."""
+        now = time.monotonic()
+        found: dict[str, str] = {}
+        missing: list[str] = []
+        for key in keys:
+            cached = self._settings_cache.get(key)
+            if cached and now - cached[0] < SETTINGS_TTL:
+                if cached[1] is not None:
+                    found[key] = cached[1]
+            else:
+                missing.append(key)
+
+        if missing:
+            # One query for every uncached key, bound as filter parameters. The
+            # SDK substitutes @names split on spaces, so parentheses need padding
+            parameters = {f"key{i}": key for i, key in enumerate(missing)}
+            key_filter = " or ".join(f"RowKey eq @{name}" for name in parameters)
+            entities = await self._query(
+                "settings",
+                f"PartitionKey eq @pk and ( {key_filter} )",
+                parameters={"pk": "settings", **parameters},
+            )
+            fetched = {e["RowKey"]: e["value"] for e in entities}
+            for key in missing:
+                self._settings_cache[key] = (now, fetched.get(key))
+            found.update(fetched)
+        return found
 
     async def set_setting(self, key: str, value: str) -> None:
         """Set a setting value."""
-        table = self._get_table("settings")
         entity = {
             "PartitionKey": "settings",
             "RowKey": key,
             "value": value,
         }
-        table.upsert_entity(entity)
+        await self._upsert("settings", entity)
+        self._settings_cache[key] = (time.monotonic(), value)
+
+    def _entity_to_user_mapping(self, entity: dict) -> UserMapping:
+        """Convert a table entity to a UserMapping."""
+        return UserMapping(
+            discord_id=int(entity["RowKey"]),
+            discord_name=entity["discord_name"],
+            calendar_email=entity["calendar_email"],
+            created_at=datetime.fromisoformat(entity["created_at"]),
+        )
+
+    def _active_row_key(self, poll: PollRecord) -> str:
+        """RowKey for a poll in the active partition, newest first."""
+        created_ms = int(poll.created_at.replace(tzinfo=timezone.utc).timestamp() * 1000)
+        return f"{REVERSE_TICKS_BASE - created_ms:019d}_{poll.id}"
+
+    def _poll_to_entity(self, poll: PollRecord) -> dict:
+        """Convert a PollRecord to a table entity in its state's partition."""
+        if poll.closed:
+            partition, row_key = CLOSED_POLLS, poll.id
+        else:
+            partition, row_key = ACTIVE_POLLS, self._active_row_key(poll)
+        return {
+            "PartitionKey": partition,
+            "RowKey": row_key,
+            "poll_id": poll.id,
+            "message_id": poll.message_id,
+            "channel_id": poll.channel_id,
+            "created_at": poll.created_at.isoformat(),
+            "closes_at": poll.closes_at.isoformat(),
+            "closed": poll.closed,
+            "winning_date": poll.winning_date.isoformat() if poll.winning_date else "",
+            "created_event_id": poll.created_event_id or "",
+            "warning_sent": poll.warning_sent,
+        }
 
     def _entity_to_poll(self, entity: dict) -> PollRecord:
         """Convert a table entity to a PollRecord."""
         return PollRecord(
-            id=entity["RowKey"],
+            id=entity.get("poll_id") or entity["RowKey"],
             message_id=entity["message_id"],
             channel_id=entity["channel_id"],
             created_at=datetime.fromisoformat(entity["created_at"]),
@@ -253,24 +526,44 @@ class AzureTableStorage(StorageBackend):
                 else None
             ),
             created_event_id=entity["created_event_id"] or None,
+            warning_sent=entity.get("warning_sent", False),
+        )
+
+    # Session reminders
+    async def get_sent_reminders(self, session_ids: list[str]) -> set[str]:
+        """Get which sessions have already had reminders sent."""
+        if not session_ids:
+            return set()
+        parameters = {f"id{i}": session_id for i, session_id in enumerate(session_ids)}
+        id_filter = " or ".join(f"RowKey eq @{name}" for name in parameters)
+        entities = await self._query(
+            "sentreminders",
+            f"PartitionKey eq @pk and ( {id_filter} )",
+            parameters={"pk": "reminders", **parameters},
+            select=["RowKey"],
         )
+        return {e["RowKey"] for e in entities}
+
+    async def mark_reminder_sent(self, session_id: str) -> None:
+        """Record that reminders were sent for a session."""
+        entity = {
+            "PartitionKey": "reminders",
+            "RowKey": session_id,
+            "sent_at": datetime.utcnow().isoformat(),
+        }
+        await self._upsert("sentreminders", entity)
 
     # Keywords
     async def get_keywords(self, category: str) -> list[str] | None:
         """Get keywords for a category."""
-        table = self._get_table("keywords")
-        try:
-            entity = table.get_entity("keywords", category)
-            return json.loads(entity["keywords"])
-        except ResourceNotFoundError:
-            return None
+        entity = await self._get_entity("keywords", "keywords", category)
+        return json.loads(entity["keywords"]) if entity else None
 
     async def set_keywords(self, category: str, keywords: list[str]) -> None:
         """Set keywords for a category."""
-        table = self._get_table("keywords")
         entity = {
             "PartitionKey": "keywords",
             "RowKey": category,
             "keywords": json.dumps(keywords),
         }
-        table.upsert_entity(entity)
+        await self._upsert("keywords", entity)
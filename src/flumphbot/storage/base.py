@@ -1,11 +1,12 @@
 """Abstract storage interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMapping:
     """Maps a Discord user to their calendar email."""
 
@@ -15,7 +16,7 @@ class UserMapping:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class PollRecord:
     """Record of a scheduling poll."""
 
@@ -27,9 +28,10 @@ class PollRecord:
     closed: bool = False
     winning_date: datetime | None = None
     created_event_id: str | None = None
+    warning_sent: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PollOption:
     """A single option in a poll."""
 
@@ -72,6 +74,23 @@ class StorageBackend(ABC):
         """Delete a user mapping."""
         pass
 
+    async def get_user_mappings_bulk(self, discord_ids: list[int]) -> dict[int, UserMapping]:
+        """Get several user mappings at once.
+
+        Backends that can read many rows in one request should override
+        this; the default issues the get_user_mapping() calls concurrently.
+
+        Args:
+            discord_ids: Discord user IDs to look up.
+
+        Returns:
+            Dictionary of Discord ID to mapping for the users that are mapped.
+        """
+        mappings = await asyncio.gather(
+            *(self.get_user_mapping(discord_id) for discord_id in discord_ids)
+        )
+        return {mapping.discord_id: mapping for mapping in mappings if mapping is not None}
+
     # Poll management
     @abstractmethod
     async def create_poll(self, poll: PollRecord, options: list[PollOption]) -> None:
@@ -93,6 +112,27 @@ class StorageBackend(ABC):
         """Get all options for a poll."""
         pass
 
+    async def get_poll_with_options(
+        self, poll_id: str
+    ) -> tuple[PollRecord, list[PollOption]] | None:
+        """Get a poll together with its options.
+
+        Backends that can read both in one request should override this;
+        the default issues get_poll() and get_poll_options() concurrently.
+
+        Args:
+            poll_id: ID of the poll.
+
+        Returns:
+            The poll record and its options ordered by date, or None.
+        """
+        poll, options = await asyncio.gather(
+            self.get_poll(poll_id), self.get_poll_options(poll_id)
+        )
+        if poll is None:
+            return None
+        return poll, options
+
     @abstractmethod
     async def update_poll(self, poll: PollRecord) -> None:
         """Update a poll record."""
@@ -103,6 +143,21 @@ class StorageBackend(ABC):
         """Update the vote count for a poll option."""
         pass
 
+    async def bulk_update_option_votes(
+        self, poll_id: str, updates: list[tuple[datetime, int]]
+    ) -> None:
+        """Update vote counts for several options of one poll.
+
+        Backends that can batch writes should override this; the default
+        falls back to one update_option_votes() call per option.
+
+        Args:
+            poll_id: The poll the options belong to.
+            updates: (date, votes) pairs to store.
+        """
+        for date, votes in updates:
+            await self.update_option_votes(poll_id, date, votes)
+
     # Settings
     @abstractmethod
     async def get_setting(self, key: str) -> str | None:
@@ -114,6 +169,45 @@ class StorageBackend(ABC):
         """Set a setting value."""
         pass
 
+    async def get_settings_bulk(self, keys: list[str]) -> dict[str, str]:
+        """Get several settings at once.
+
+        Backends that can read many keys in one request should override
+        this; the default issues the get_setting() calls concurrently.
+
+        Args:
+            keys: Setting keys to read.
+
+        Returns:
+            Dictionary of key to value for the keys that are set.
+        """
+        values = await asyncio.gather(*(self.get_setting(key) for key in keys))
+        return {
+            key: value for key, value in zip(keys, values, strict=True) if value is not None
+        }
+
+    # Session reminders
+    @abstractmethod
+    async def get_sent_reminders(self, session_ids: list[str]) -> set[str]:
+        """Get which sessions have already had reminders sent.
+
+        Args:
+            session_ids: Calendar event IDs of the sessions to check.
+
+        Returns:
+            The subset of session_ids that were already reminded.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_reminder_sent(self, session_id: str) -> None:
+        """Record that reminders were sent for a session.
+
+        Args:
+            session_id: Calendar event ID of the session.
+        """
+        pass
+
     # Keywords
     @abstractmethod
     async def get_keywords(self, category: str) -> list[str] | None:
@@ -1,9 +1,16 @@
 """SQLite storage backend for local development and self-hosted deployments."""
 
+import asyncio
 import json
 import logging
-from datetime import datetime
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 import aiosqlite
 
@@ -16,6 +23,259 @@ from flumphbot.storage.base import (
 
 logger = logging.getLogger(__name__)
 
+# Path that opens a private in-memory database; WAL does not apply to it
+MEMORY_DB = ":memory:"
+
+# Prefix of SQLite URI filenames, e.g. file::memory:?cache=shared for tests
+URI_PREFIX = "file:"
+
+# Connection tuning: WAL lets readers run alongside the writer and, with
+# synchronous=NORMAL, commits no longer fsync the main database each time
+WAL_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+"""
+CONNECTION_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+    PRAGMA foreign_keys=ON;
+"""
+
+# Upper bound on read-only connections; WAL readers never block the writer
+MAX_READERS = 4
+
+# User mappings kept in memory; the least recently used are evicted first
+USER_CACHE_SIZE = 512
+
+# Seconds a cached user mapping is served; other tools may edit mappings
+USER_CACHE_TTL = 60.0
+
+# Schema revision kept in PRAGMA user_version; revision 1 stores timestamps
+# as INTEGER microseconds since the Unix epoch instead of ISO text
+SCHEMA_VERSION = 1
+
+# Timestamp columns per table, converted from ISO text when migrating to 1
+_TIMESTAMP_COLUMNS = {
+    "user_mappings": ("created_at",),
+    "polls": ("created_at", "closes_at", "winning_date"),
+    "poll_options": ("date",),
+    "sent_reminders": ("sent_at",),
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Schema, applied idempotently on every start
+_SQL_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS user_mappings (
+        discord_id INTEGER PRIMARY KEY,
+        discord_name TEXT NOT NULL,
+        calendar_email TEXT NOT NULL,
+        created_at INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS polls (
+        id TEXT PRIMARY KEY,
+        message_id INTEGER NOT NULL,
+        channel_id INTEGER NOT NULL,
+        created_at INTEGER NOT NULL,
+        closes_at INTEGER NOT NULL,
+        closed INTEGER DEFAULT 0,
+        winning_date INTEGER,
+        created_event_id TEXT,
+        warning_sent INTEGER DEFAULT 0
+    );
+
+    -- Only open polls are indexed, so the active-poll lookup stays one descent
+    CREATE INDEX IF NOT EXISTS idx_polls_active
+        ON polls(created_at DESC) WHERE closed = 0;
+
+    CREATE TABLE IF NOT EXISTS poll_options (
+        poll_id TEXT NOT NULL,
+        date INTEGER NOT NULL,
+        vote_count INTEGER DEFAULT 0,
+        PRIMARY KEY (poll_id, date),
+        FOREIGN KEY (poll_id) REFERENCES polls(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS keywords (
+        category TEXT PRIMARY KEY,
+        keywords TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS sent_reminders (
+        session_id TEXT PRIMARY KEY,
+        sent_at INTEGER NOT NULL
+    );
+"""
+
+# Statements, kept at module scope so each call reuses the same string.
+# Selects name their columns so rows can be unpacked by position.
+_USER_COLUMNS = "discord_id, discord_name, calendar_email, created_at"
+_POLL_COLUMNS = (
+    "id, message_id, channel_id, created_at, closes_at, closed, "
+    "winning_date, created_event_id, warning_sent"
+)
+
+_SQL_SELECT_USER = f"SELECT {_USER_COLUMNS} FROM user_mappings WHERE discord_id = ?"
+_SQL_SELECT_USERS_IN = f"SELECT {_USER_COLUMNS} FROM user_mappings WHERE discord_id IN ({{}})"
+_SQL_SELECT_ALL_USERS = f"SELECT {_USER_COLUMNS} FROM user_mappings"
+# Upserts update the row in place instead of deleting and re-inserting it;
+# a relinked user keeps their original created_at
+_SQL_UPSERT_USER = """
+    INSERT INTO user_mappings (discord_id, discord_name, calendar_email, created_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(discord_id) DO UPDATE SET
+        discord_name = excluded.discord_name,
+        calendar_email = excluded.calendar_email
+"""
+_SQL_DELETE_USER = "DELETE FROM user_mappings WHERE discord_id = ?"
+
+_SQL_INSERT_POLL = """
+    INSERT INTO polls
+    (id, message_id, channel_id, created_at, closes_at, closed,
+     winning_date, created_event_id, warning_sent)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_OPTION = "INSERT INTO poll_options (poll_id, date, vote_count) VALUES (?, ?, ?)"
+_SQL_SELECT_POLL = f"SELECT {_POLL_COLUMNS} FROM polls WHERE id = ?"
+_SQL_SELECT_ACTIVE_POLL = (
+    f"SELECT {_POLL_COLUMNS} FROM polls WHERE closed = 0 ORDER BY created_at DESC LIMIT 1"
+)
+_SQL_SELECT_OPTIONS = (
+    "SELECT poll_id, date, vote_count FROM poll_options WHERE poll_id = ? ORDER BY date"
+)
+_SQL_SELECT_POLL_WITH_OPTIONS = f"""
+    SELECT {_POLL_COLUMNS}, date, vote_count
+    FROM polls LEFT JOIN poll_options ON poll_options.poll_id = polls.id
+    WHERE polls.id = ?
+    ORDER BY date
+"""
+_SQL_UPDATE_POLL = """
+    UPDATE polls SET
+        closed = ?,
+        winning_date = ?,
+        created_event_id = ?,
+        warning_sent = ?
+    WHERE id = ?
+"""
+_SQL_UPDATE_VOTES = "UPDATE poll_options SET vote_count = ? WHERE poll_id = ? AND date = ?"
+
+_SQL_SELECT_SETTING = "SELECT value FROM settings WHERE key = ?"
+_SQL_SELECT_SETTINGS_IN = "SELECT key, value FROM settings WHERE key IN ({})"
+_SQL_UPSERT_SETTING = """
+    INSERT INTO settings (key, value) VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+_SQL_SELECT_SENT_REMINDERS_IN = (
+    "SELECT session_id FROM sent_reminders WHERE session_id IN ({})"
+)
+_SQL_UPSERT_SENT_REMINDER = """
+    INSERT INTO sent_reminders (session_id, sent_at) VALUES (?, ?)
+    ON CONFLICT(session_id) DO UPDATE SET sent_at = excluded.sent_at
+"""
+
+# Sent flags kept as reminder_sent_<event id> / pollwarn_sent_<poll id>
+# settings rows before they had their own table and column; both prefixes
+# are 14 characters long
+_SQL_IMPORT_LEGACY_REMINDERS = """
+    INSERT OR IGNORE INTO sent_reminders (session_id, sent_at)
+    SELECT substr(key, 15), ? FROM settings WHERE substr(key, 1, 14) = 'reminder_sent_'
+"""
+_SQL_IMPORT_LEGACY_WARNINGS = """
+    UPDATE polls SET warning_sent = 1
+    WHERE id IN (
+        SELECT substr(key, 15) FROM settings WHERE substr(key, 1, 14) = 'pollwarn_sent_'
+    )
+"""
+_SQL_DELETE_LEGACY_SENT_FLAGS = """
+    DELETE FROM settings WHERE substr(key, 1, 14) IN ('reminder_sent_', 'pollwarn_sent_')
+"""
+
+_SQL_SELECT_KEYWORDS = "SELECT keywords FROM keywords WHERE category = ?"
+_SQL_UPSERT_KEYWORDS = """
+    INSERT INTO keywords (category, keywords) VALUES (?, ?)
+    ON CONFLICT(category) DO UPDATE SET keywords = excluded.keywords
+"""
+
+# Hot reads run once on each reader at startup to prime its statement cache
+# and pull the schema and root pages into the page cache
+_WARMUP_QUERIES: tuple[tuple[str, tuple[object, ...]], ...] = (
+    (_SQL_SELECT_USER, (0,)),
+    (_SQL_SELECT_POLL, ("",)),
+    (_SQL_SELECT_ACTIVE_POLL, ()),
+    (_SQL_SELECT_OPTIONS, ("",)),
+    (_SQL_SELECT_SETTING, ("",)),
+    (_SQL_SELECT_KEYWORDS, ("",)),
+)
+
+
+def _to_epoch(value: datetime) -> int:
+    """Convert a UTC datetime to integer microseconds since the Unix epoch.
+
+    Naive values are taken as UTC, like everywhere else in the bot; aware
+    values are normalised to UTC first.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch(value: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch to naive UTC."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _convert_legacy_row(row: Sequence[Any], timestamps: list[int]) -> tuple[object, ...]:
+    """Convert the ISO text timestamps at the given positions to epochs."""
+    values = list(row)
+    for index in timestamps:
+        if values[index]:
+            values[index] = _to_epoch(datetime.fromisoformat(values[index]))
+    return tuple(values)
+
+
+def _placeholders(count: int) -> str:
+    """Comma-separated parameter markers for an IN clause."""
+    return ", ".join("?" * count)
+
+
+class _ConnectionPool:
+    """Fixed set of connections handed out to one caller at a time."""
+
+    def __init__(self, connections: list[aiosqlite.Connection]):
+        """Initialize the pool.
+
+        Args:
+            connections: Open connections to hand out.
+        """
+        self.connections = tuple(connections)
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        for conn in connections:
+            self._idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection, waiting until one is idle."""
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every connection in the pool."""
+        for conn in self.connections:
+            await conn.close()
+
 
 class SQLiteStorage(StorageBackend):
     """SQLite-based storage backend."""
@@ -24,288 +284,484 @@ class SQLiteStorage(StorageBackend):
         """Initialize the SQLite storage.
 
         Args:
-            db_path: Path to the SQLite database file.
+            db_path: Path to the SQLite database file, ":memory:", or a
+                ``file:`` URI such as ``file::memory:?cache=shared``.
         """
         self.db_path = Path(db_path)
-        self._connection: aiosqlite.Connection | None = None
+        self._uri = db_path if db_path.startswith(URI_PREFIX) else None
+        self._writer: _ConnectionPool | None = None
+        self._readers: _ConnectionPool | None = None
+        self._open_lock = asyncio.Lock()
+        # Settings are only written through this class, so their cache is
+        # write-through and never expires. User mappings can also be changed
+        # outside the bot, so those entries expire after USER_CACHE_TTL. None
+        # records a key or user known to be absent.
+        self._settings_cache: dict[str, str | None] = {}
+        self._user_cache: OrderedDict[int, tuple[float, UserMapping | None]] = OrderedDict()
+        # Bumped by every mapping write; a read that overlapped one is not cached
+        self._user_writes = 0
+
+    @property
+    def _in_memory(self) -> bool:
+        """Whether the database lives in memory rather than in a file."""
+        if self._uri is not None:
+            return self._uri.startswith("file::memory:") or "mode=memory" in self._uri
+        return str(self.db_path) == MEMORY_DB
+
+    async def _connect(self, read_only: bool = False) -> aiosqlite.Connection:
+        """Open a tuned connection to the database.
 
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get or create the database connection."""
-        if self._connection is None:
-            self._connection = await aiosqlite.connect(self.db_path)
-            self._connection.row_factory = aiosqlite.Row
-        return self._connection
+        Args:
+            read_only: Open through a ``mode=ro`` URI for use as a reader.
+        """
+        if read_only:
+            if self._uri is None:
+                uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            else:
+                uri = f"{self._uri}{'&' if '?' in self._uri else '?'}mode=ro"
+            conn = await aiosqlite.connect(uri, uri=True)
+        elif self._uri is not None:
+            conn = await aiosqlite.connect(self._uri, uri=True)
+        else:
+            conn = await aiosqlite.connect(self.db_path)
+        if not read_only and not self._in_memory:
+            await conn.executescript(WAL_PRAGMAS)
+        await conn.executescript(CONNECTION_PRAGMAS)
+        return conn
+
+    async def _get_pools(self) -> tuple[_ConnectionPool, _ConnectionPool]:
+        """Get the writer and reader pools, opening them on first use."""
+        if self._writer is not None and self._readers is not None:
+            return self._writer, self._readers
+        async with self._open_lock:
+            if self._writer is None or self._readers is None:
+                writer = _ConnectionPool([await self._connect()])
+                if self._in_memory:
+                    # Readers would see a private empty database, or contend
+                    # for the shared-cache table locks with no WAL to help
+                    readers = writer
+                else:
+                    size = min(MAX_READERS, os.cpu_count() or 1)
+                    readers = _ConnectionPool(
+                        [await self._connect(read_only=True) for _ in range(size)]
+                    )
+                self._writer, self._readers = writer, readers
+            return self._writer, self._readers
+
+    @asynccontextmanager
+    async def _acquire_read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection."""
+        _, readers = await self._get_pools()
+        async with readers.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _acquire_write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow the single writer connection."""
+        writer, _ = await self._get_pools()
+        async with writer.acquire() as conn:
+            yield conn
 
     async def initialize(self) -> None:
         """Create database tables if they don't exist."""
-        conn = await self._get_connection()
+        async with self._acquire_write() as conn:
+            async with conn.execute("PRAGMA user_version") as cursor:
+                row = await cursor.fetchone()
+            # Both paths apply the DDL inside one transaction, so a new
+            # database is created with a single commit
+            if (row[0] if row else 0) < SCHEMA_VERSION:
+                await self._migrate_to_epoch(conn)
+            else:
+                await conn.executescript(f"BEGIN;\n{_SQL_SCHEMA}")
+            await self._import_legacy_sent_flags(conn)
+            await conn.commit()
+
+        # Warm every reader now rather than on the first Discord command
+        _, readers = await self._get_pools()
+        for reader in readers.connections:
+            for sql, params in _WARMUP_QUERIES:
+                async with reader.execute(sql, params) as cursor:
+                    await cursor.fetchall()
+        logger.info(f"SQLite database initialized at {self.db_path}")
 
-        await conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS user_mappings (
-                discord_id INTEGER PRIMARY KEY,
-                discord_name TEXT NOT NULL,
-                calendar_email TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS polls (
-                id TEXT PRIMARY KEY,
-                message_id INTEGER NOT NULL,
-                channel_id INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                closes_at TEXT NOT NULL,
-                closed INTEGER DEFAULT 0,
-                winning_date TEXT,
-                created_event_id TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS poll_options (
-                poll_id TEXT NOT NULL,
-                date TEXT NOT NULL,
-                vote_count INTEGER DEFAULT 0,
-                PRIMARY KEY (poll_id, date),
-                FOREIGN KEY (poll_id) REFERENCES polls(id)
-            );
-
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS keywords (
-                category TEXT PRIMARY KEY,
-                keywords TEXT NOT NULL
-            );
+    async def _migrate_to_epoch(self, conn: aiosqlite.Connection) -> None:
+        """Rebuild tables that store timestamps as ISO text with INTEGER epochs.
+
+        The old tables are renamed aside, the current schema is created, and
+        rows are copied across with their timestamps converted, all in one
+        transaction. Columns missing from older tables, such as warning_sent,
+        take their defaults. On a new database this only creates the schema.
+
+        Args:
+            conn: The writer connection.
         """
+        async with conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'") as cursor:
+            existing = {name for (name,) in await cursor.fetchall()}
+        legacy = [table for table in _TIMESTAMP_COLUMNS if table in existing]
+
+        # Index names are global, so the old partial index must go before the
+        # schema recreates it on the new polls table
+        renames = "".join(f"ALTER TABLE {table} RENAME TO legacy_{table};\n" for table in legacy)
+        await conn.executescript(
+            f"BEGIN;\nDROP INDEX IF EXISTS idx_polls_active;\n{renames}{_SQL_SCHEMA}"
         )
-        await conn.commit()
-        logger.info(f"SQLite database initialized at {self.db_path}")
+        try:
+            for table in legacy:
+                timestamps = _TIMESTAMP_COLUMNS[table]
+                async with conn.execute(f"SELECT * FROM legacy_{table}") as cursor:
+                    columns = [column[0] for column in cursor.description]
+                    rows = list(await cursor.fetchall())
+                if not rows:
+                    continue
+                converted = [
+                    index for index, column in enumerate(columns) if column in timestamps
+                ]
+                await conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({_placeholders(len(columns))})",
+                    [_convert_legacy_row(row, converted) for row in rows],
+                )
+                logger.info(f"Migrated {len(rows)} {table} rows to epoch timestamps")
+
+            # Options reference polls, so drop child tables first
+            for table in reversed(legacy):
+                await conn.execute(f"DROP TABLE legacy_{table}")
+            await conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except Exception:
+            await conn.rollback()
+            raise
+
+    async def _import_legacy_sent_flags(self, conn: aiosqlite.Connection) -> None:
+        """Carry sent flags stored as settings rows over to their new homes.
+
+        Reminders already sent become sent_reminders rows and warned polls
+        get warning_sent set, so upgrading does not send either twice. The
+        settings rows are then deleted, making later starts a no-op.
+
+        Args:
+            conn: The writer connection, inside the initialize transaction.
+        """
+        await conn.execute(_SQL_IMPORT_LEGACY_REMINDERS, (_to_epoch(datetime.utcnow()),))
+        await conn.execute(_SQL_IMPORT_LEGACY_WARNINGS)
+        await conn.execute(_SQL_DELETE_LEGACY_SENT_FLAGS)
 
     async def close(self) -> None:
-        """Close the database connection."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
+        """Close the reader and writer connections.
+
+        Planner statistics are refreshed and the WAL is checkpointed and
+        truncated first, so the next start does not replay it. Safe to call
+        more than once; shutdown never raises.
+        """
+        writer, readers = self._writer, self._readers
+        self._writer = self._readers = None
+
+        try:
+            if readers is not None and readers is not writer:
+                await readers.close()
+            if writer is None:
+                return
+            async with writer.acquire() as conn:
+                await conn.execute("PRAGMA optimize")
+                if not self._in_memory:
+                    await conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception:
+            logger.exception("Error tidying SQLite database on close")
+        finally:
+            if writer is not None:
+                await writer.close()
 
     # User mappings
     async def get_user_mapping(self, discord_id: int) -> UserMapping | None:
         """Get a user mapping by Discord ID."""
-        conn = await self._get_connection()
-        async with conn.execute(
-            "SELECT * FROM user_mappings WHERE discord_id = ?", (discord_id,)
-        ) as cursor:
+        cached = self._user_cache.get(discord_id)
+        if cached and time.monotonic() - cached[0] < USER_CACHE_TTL:
+            self._user_cache.move_to_end(discord_id)
+            return cached[1]
+
+        writes = self._user_writes
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_USER, (discord_id,)) as cursor,
+        ):
             row = await cursor.fetchone()
-            if row:
-                return UserMapping(
-                    discord_id=row["discord_id"],
-                    discord_name=row["discord_name"],
-                    calendar_email=row["calendar_email"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-            return None
+            mapping = self._row_to_mapping(row) if row else None
+        if writes == self._user_writes:
+            self._cache_user(discord_id, mapping)
+        return mapping
+
+    def _cache_user(self, discord_id: int, mapping: UserMapping | None) -> None:
+        """Remember a user mapping lookup, evicting the least recently used."""
+        self._user_cache[discord_id] = (time.monotonic(), mapping)
+        self._user_cache.move_to_end(discord_id)
+        if len(self._user_cache) > USER_CACHE_SIZE:
+            self._user_cache.popitem(last=False)
+
+    async def get_user_mappings_bulk(self, discord_ids: list[int]) -> dict[int, UserMapping]:
+        """Get several user mappings in a single query."""
+        if not discord_ids:
+            return {}
+        sql = _SQL_SELECT_USERS_IN.format(_placeholders(len(discord_ids)))
+        async with self._acquire_read() as conn, conn.execute(sql, discord_ids) as cursor:
+            rows = await cursor.fetchall()
+        return {row[0]: self._row_to_mapping(row) for row in rows}
 
     async def set_user_mapping(self, mapping: UserMapping) -> None:
         """Create or update a user mapping."""
-        conn = await self._get_connection()
-        await conn.execute(
-            """
-            INSERT OR REPLACE INTO user_mappings
-            (discord_id, discord_name, calendar_email, created_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                mapping.discord_id,
-                mapping.discord_name,
-                mapping.calendar_email,
-                mapping.created_at.isoformat(),
-            ),
-        )
-        await conn.commit()
+        async with self._acquire_write() as conn:
+            await conn.execute(
+                _SQL_UPSERT_USER,
+                (
+                    mapping.discord_id,
+                    mapping.discord_name,
+                    mapping.calendar_email,
+                    _to_epoch(mapping.created_at),
+                ),
+            )
+            await conn.commit()
+        # An existing row keeps its created_at, so re-read rather than cache
+        self._user_writes += 1
+        self._user_cache.pop(mapping.discord_id, None)
 
     async def get_all_user_mappings(self) -> list[UserMapping]:
         """Get all user mappings."""
-        conn = await self._get_connection()
-        async with conn.execute("SELECT * FROM user_mappings") as cursor:
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_ALL_USERS) as cursor,
+        ):
             rows = await cursor.fetchall()
-            return [
-                UserMapping(
-                    discord_id=row["discord_id"],
-                    discord_name=row["discord_name"],
-                    calendar_email=row["calendar_email"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-                for row in rows
-            ]
+        return [self._row_to_mapping(row) for row in rows]
 
     async def delete_user_mapping(self, discord_id: int) -> None:
         """Delete a user mapping."""
-        conn = await self._get_connection()
-        await conn.execute(
-            "DELETE FROM user_mappings WHERE discord_id = ?", (discord_id,)
-        )
-        await conn.commit()
+        async with self._acquire_write() as conn:
+            await conn.execute(_SQL_DELETE_USER, (discord_id,))
+            await conn.commit()
+        self._user_writes += 1
+        self._cache_user(discord_id, None)
 
     # Poll management
     async def create_poll(self, poll: PollRecord, options: list[PollOption]) -> None:
         """Create a new poll with its options."""
-        conn = await self._get_connection()
-
-        await conn.execute(
-            """
-            INSERT INTO polls
-            (id, message_id, channel_id, created_at, closes_at, closed, winning_date, created_event_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                poll.id,
-                poll.message_id,
-                poll.channel_id,
-                poll.created_at.isoformat(),
-                poll.closes_at.isoformat(),
-                1 if poll.closed else 0,
-                poll.winning_date.isoformat() if poll.winning_date else None,
-                poll.created_event_id,
-            ),
-        )
-
-        for option in options:
-            await conn.execute(
-                """
-                INSERT INTO poll_options (poll_id, date, vote_count)
-                VALUES (?, ?, ?)
-                """,
-                (option.poll_id, option.date.isoformat(), option.vote_count),
-            )
-
-        await conn.commit()
+        async with self._acquire_write() as conn:
+            # Take the write lock up front and write the poll with its options as
+            # one transaction
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                await conn.execute(
+                    _SQL_INSERT_POLL,
+                    (
+                        poll.id,
+                        poll.message_id,
+                        poll.channel_id,
+                        _to_epoch(poll.created_at),
+                        _to_epoch(poll.closes_at),
+                        poll.closed,
+                        _to_epoch(poll.winning_date) if poll.winning_date else None,
+                        poll.created_event_id,
+                        poll.warning_sent,
+                    ),
+                )
+                await conn.executemany(
+                    _SQL_INSERT_OPTION,
+                    [
+                        (option.poll_id, _to_epoch(option.date), option.vote_count)
+                        for option in options
+                    ],
+                )
+            except Exception:
+                await conn.rollback()
+                raise
+            await conn.commit()
 
     async def get_poll(self, poll_id: str) -> PollRecord | None:
         """Get a poll by ID."""
-        conn = await self._get_connection()
-        async with conn.execute(
-            "SELECT * FROM polls WHERE id = ?", (poll_id,)
-        ) as cursor:
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_POLL, (poll_id,)) as cursor,
+        ):
             row = await cursor.fetchone()
-            if row:
-                return self._row_to_poll(row)
-            return None
+        return self._row_to_poll(row) if row else None
 
     async def get_active_poll(self) -> PollRecord | None:
         """Get the currently active (not closed) poll."""
-        conn = await self._get_connection()
-        async with conn.execute(
-            "SELECT * FROM polls WHERE closed = 0 ORDER BY created_at DESC LIMIT 1"
-        ) as cursor:
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_ACTIVE_POLL) as cursor,
+        ):
             row = await cursor.fetchone()
-            if row:
-                return self._row_to_poll(row)
-            return None
+        return self._row_to_poll(row) if row else None
 
     async def get_poll_options(self, poll_id: str) -> list[PollOption]:
         """Get all options for a poll."""
-        conn = await self._get_connection()
-        async with conn.execute(
-            "SELECT * FROM poll_options WHERE poll_id = ? ORDER BY date",
-            (poll_id,),
-        ) as cursor:
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_OPTIONS, (poll_id,)) as cursor,
+        ):
             rows = await cursor.fetchall()
-            return [
-                PollOption(
-                    poll_id=row["poll_id"],
-                    date=datetime.fromisoformat(row["date"]),
-                    vote_count=row["vote_count"],
-                )
-                for row in rows
-            ]
+        return [
+            PollOption(poll_id=poll_id, date=_from_epoch(date), vote_count=vote_count)
+            for poll_id, date, vote_count in rows
+        ]
+
+    async def get_poll_with_options(
+        self, poll_id: str
+    ) -> tuple[PollRecord, list[PollOption]] | None:
+        """Get a poll and its options with a single join."""
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_POLL_WITH_OPTIONS, (poll_id,)) as cursor,
+        ):
+            rows = list(await cursor.fetchall())
+        if not rows:
+            return None
+
+        # Poll columns repeat on every row; a poll without options yields one
+        # row with NULL option columns
+        poll = self._row_to_poll(rows[0][:-2])
+        options = [
+            PollOption(poll_id=poll_id, date=_from_epoch(date), vote_count=vote_count)
+            for *_, date, vote_count in rows
+            if date is not None
+        ]
+        return poll, options
 
     async def update_poll(self, poll: PollRecord) -> None:
         """Update a poll record."""
-        conn = await self._get_connection()
-        await conn.execute(
-            """
-            UPDATE polls SET
-                closed = ?,
-                winning_date = ?,
-                created_event_id = ?
-            WHERE id = ?
-            """,
-            (
-                1 if poll.closed else 0,
-                poll.winning_date.isoformat() if poll.winning_date else None,
-                poll.created_event_id,
-                poll.id,
-            ),
-        )
-        await conn.commit()
+        async with self._acquire_write() as conn:
+            await conn.execute(
+                _SQL_UPDATE_POLL,
+                (
+                    poll.closed,
+                    _to_epoch(poll.winning_date) if poll.winning_date else None,
+                    poll.created_event_id,
+                    poll.warning_sent,
+                    poll.id,
+                ),
+            )
+            await conn.commit()
 
     async def update_option_votes(
         self, poll_id: str, date: datetime, votes: int
     ) -> None:
         """Update the vote count for a poll option."""
-        conn = await self._get_connection()
-        await conn.execute(
-            """
-            UPDATE poll_options SET vote_count = ?
-            WHERE poll_id = ? AND date = ?
-            """,
-            (votes, poll_id, date.isoformat()),
-        )
-        await conn.commit()
+        async with self._acquire_write() as conn:
+            await conn.execute(_SQL_UPDATE_VOTES, (votes, poll_id, _to_epoch(date)))
+            await conn.commit()
+
+    async def bulk_update_option_votes(
+        self, poll_id: str, updates: list[tuple[datetime, int]]
+    ) -> None:
+        """Update several option vote counts with one statement and commit."""
+        if not updates:
+            return
+        async with self._acquire_write() as conn:
+            await conn.executemany(
+                _SQL_UPDATE_VOTES,
+                [(votes, poll_id, _to_epoch(date)) for date, votes in updates],
+            )
+            await conn.commit()
 
     # Settings
     async def get_setting(self, key: str) -> str | None:
         """Get a setting value."""
-        conn = await self._get_connection()
-        async with conn.execute(
-            "SELECT value FROM settings WHERE key = ?", (key,)
-        ) as cursor:
+        if key in self._settings_cache:
+            return self._settings_cache[key]
+
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_SETTING, (key,)) as cursor,
+        ):
             row = await cursor.fetchone()
-            return row["value"] if row else None
+            value = row[0] if row else None
+        # A set_setting that finished during the read has already cached the
+        # newer value, which must win over what this read saw
+        return self._settings_cache.setdefault(key, value)
+
+    async def get_settings_bulk(self, keys: list[str]) -> dict[str, str]:
+        """Get several settings, reading only uncached keys in a single query."""
+        missing = [key for key in keys if key not in self._settings_cache]
+        if missing:
+            sql = _SQL_SELECT_SETTINGS_IN.format(_placeholders(len(missing)))
+            async with self._acquire_read() as conn, conn.execute(sql, missing) as cursor:
+                fetched = {row[0]: row[1] for row in await cursor.fetchall()}
+            for key in missing:
+                self._settings_cache.setdefault(key, fetched.get(key))
+
+        values = {key: self._settings_cache[key] for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
 
     async def set_setting(self, key: str, value: str) -> None:
         """Set a setting value."""
-        conn = await self._get_connection()
-        await conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-            (key, value),
+        async with self._acquire_write() as conn:
+            await conn.execute(_SQL_UPSERT_SETTING, (key, value))
+            await conn.commit()
+        self._settings_cache[key] = value
+
+    def _row_to_mapping(self, row: Sequence[Any]) -> UserMapping:
+        """Convert a database row to a UserMapping."""
+        discord_id, discord_name, calendar_email, created_at = row
+        return UserMapping(
+            discord_id=discord_id,
+            discord_name=discord_name,
+            calendar_email=calendar_email,
+            created_at=_from_epoch(created_at),
         )
-        await conn.commit()
 
-    def _row_to_poll(self, row: aiosqlite.Row) -> PollRecord:
+    def _row_to_poll(self, row: Sequence[Any]) -> PollRecord:
         """Convert a database row to a PollRecord."""
+        (
+            poll_id,
+            message_id,
+            channel_id,
+            created_at,
+            closes_at,
+            closed,
+            winning_date,
+            created_event_id,
+            warning_sent,
+        ) = row
         return PollRecord(
-            id=row["id"],
-            message_id=row["message_id"],
-            channel_id=row["channel_id"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            closes_at=datetime.fromisoformat(row["closes_at"]),
-            closed=bool(row["closed"]),
-            winning_date=(
-                datetime.fromisoformat(row["winning_date"])
-                if row["winning_date"]
-                else None
-            ),
-            created_event_id=row["created_event_id"],
+            id=poll_id,
+            message_id=message_id,
+            channel_id=channel_id,
+            created_at=_from_epoch(created_at),
+            closes_at=_from_epoch(closes_at),
+            closed=bool(closed),
+            winning_date=_from_epoch(winning_date) if winning_date is not None else None,
+            created_event_id=created_event_id,
+            warning_sent=bool(warning_sent),
         )
 
+    # Session reminders
+    async def get_sent_reminders(self, session_ids: list[str]) -> set[str]:
+        """Get which sessions have already had reminders sent."""
+        if not session_ids:
+            return set()
+        sql = _SQL_SELECT_SENT_REMINDERS_IN.format(_placeholders(len(session_ids)))
+        async with self._acquire_read() as conn, conn.execute(sql, session_ids) as cursor:
+            rows = await cursor.fetchall()
+        return {session_id for (session_id,) in rows}
+
+    async def mark_reminder_sent(self, session_id: str) -> None:
+        """Record that reminders were sent for a session."""
+        async with self._acquire_write() as conn:
+            await conn.execute(
+                _SQL_UPSERT_SENT_REMINDER, (session_id, _to_epoch(datetime.utcnow()))
+            )
+            await conn.commit()
+
     # Keywords
     async def get_keywords(self, category: str) -> list[str] | None:
         """Get keywords for a category."""
-        conn = await self._get_connection()
-        async with conn.execute(
-            "SELECT keywords FROM keywords WHERE category = ?", (category,)
-        ) as cursor:
+        async with (
+            self._acquire_read() as conn,
+            conn.execute(_SQL_SELECT_KEYWORDS, (category,)) as cursor,
+        ):
             row = await cursor.fetchone()
-            if row:
-                return json.loads(row["keywords"])
-            return None
+        return json.loads(row[0]) if row else None
 
     async def set_keywords(self, category: str, keywords: list[str]) -> None:
         """Set keywords for a category."""
-        conn = await self._get_connection()
-        await conn.execute(
-            "INSERT OR REPLACE INTO keywords (category, keywords) VALUES (?, ?)",
-            (category, json.dumps(keywords)),
-        )
-        await conn.commit()
+        async with self._acquire_write() as conn:
+            await conn.execute(_SQL_UPSERT_KEYWORDS, (category, json.dumps(keywords)))
+            await conn.commit()
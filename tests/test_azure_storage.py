@@ -0,0 +1,282 @@
+"""Tests for the Azure Table Storage backend against mocked table clients."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from flumphbot.storage.azure_tables import (
+    ACTIVE_POLLS,
+    CLOSED_POLLS,
+    LEGACY_POLLS,
+    MAX_BATCH_SIZE,
+    TABLE_NAMES,
+    AzureTableStorage,
+)
+from flumphbot.storage.base import PollRecord
+
+# azure-data-tables is optional; its filter substitution checks our padding
+_serialize = pytest.importorskip("azure.data.tables._serialize")
+
+
+def _odata_filter(query_call) -> str:
+    """Substitute a query_entities call's parameters the way the SDK does."""
+    return _serialize._parameter_filter_substitution(
+        query_call.kwargs.get("parameters"), query_call.args[0]
+    )
+
+
+@pytest.fixture
+def tables():
+    """Create one mocked TableClient per table."""
+    return {name: MagicMock(name=name) for name in TABLE_NAMES}
+
+
+@pytest.fixture
+def azure_storage(tables):
+    """Create an Azure storage whose table clients are mocks."""
+    storage = AzureTableStorage("UseDevelopmentStorage=true")
+    storage._tables = tables
+    return storage
+
+
+class TestPollOptions:
+    """Tests for batched poll option writes."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_in_transactions_of_max_batch_size(self, azure_storage, tables):
+        start = datetime(2024, 3, 15)
+        updates = [(start + timedelta(days=i), i) for i in range(MAX_BATCH_SIZE * 2 + 5)]
+
+        await azure_storage.bulk_update_option_votes("poll1", updates)
+
+        batches = [c.args[0] for c in tables["polloptions"].submit_transaction.call_args_list]
+        assert [len(batch) for batch in batches] == [MAX_BATCH_SIZE, MAX_BATCH_SIZE, 5]
+        operations = [op for batch in batches for op in batch]
+        assert operations[0] == (
+            "upsert",
+            {"PartitionKey": "poll1", "RowKey": start.isoformat(), "vote_count": 0},
+        )
+        assert [op[1]["RowKey"] for op in operations] == [d.isoformat() for d, _ in updates]
+        assert {op[1]["PartitionKey"] for op in operations} == {"poll1"}
+
+
+class TestSettings:
+    """Tests for cached and bulk settings reads."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_queries_keys_in_one_filter(self, azure_storage, tables):
+        tables["settings"].query_entities.return_value = [
+            {"RowKey": "schedule_day", "value": "Friday"},
+            {"RowKey": "schedule_hour", "value": "18"},
+        ]
+
+        found = await azure_storage.get_settings_bulk(
+            ["schedule_day", "schedule_hour", "tag_everyone"]
+        )
+
+        assert found == {"schedule_day": "Friday", "schedule_hour": "18"}
+        tables["settings"].query_entities.assert_called_once()
+        assert _odata_filter(tables["settings"].query_entities.call_args) == (
+            "PartitionKey eq 'settings' and ( RowKey eq 'schedule_day' "
+            "or RowKey eq 'schedule_hour' or RowKey eq 'tag_everyone' )"
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_serves_cached_keys(self, azure_storage, tables):
+        tables["settings"].query_entities.return_value = [
+            {"RowKey": "schedule_day", "value": "Friday"},
+        ]
+        await azure_storage.get_settings_bulk(["schedule_day", "tag_everyone"])
+        tables["settings"].query_entities.reset_mock()
+
+        # Missing keys are cached too, so only the new key is queried
+        tables["settings"].query_entities.return_value = []
+        found = await azure_storage.get_settings_bulk(
+            ["schedule_day", "tag_everyone", "schedule_hour"]
+        )
+
+        assert found == {"schedule_day": "Friday"}
+        assert _odata_filter(tables["settings"].query_entities.call_args) == (
+            "PartitionKey eq 'settings' and ( RowKey eq 'schedule_hour' )"
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_setting_refreshes_cache(self, azure_storage, tables):
+        await azure_storage.set_setting("schedule_day", "Sunday")
+
+        assert await azure_storage.get_setting("schedule_day") == "Sunday"
+        tables["settings"].get_entity.assert_not_called()
+
+
+class TestSentReminders:
+    """Tests for sent-reminder tracking and the legacy settings import."""
+
+    @pytest.mark.asyncio
+    async def test_get_sent_reminders_queries_ids_in_one_filter(self, azure_storage, tables):
+        tables["sentreminders"].query_entities.return_value = [{"RowKey": "evt1"}]
+
+        sent = await azure_storage.get_sent_reminders(["evt1", "evt2"])
+
+        assert sent == {"evt1"}
+        assert _odata_filter(tables["sentreminders"].query_entities.call_args) == (
+            "PartitionKey eq 'reminders' and ( RowKey eq 'evt1' or RowKey eq 'evt2' )"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_sent_reminders_skips_query_without_ids(self, azure_storage, tables):
+        assert await azure_storage.get_sent_reminders([]) == set()
+        tables["sentreminders"].query_entities.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mark_reminder_sent_upserts_row(self, azure_storage, tables):
+        await azure_storage.mark_reminder_sent("evt1")
+
+        entity = tables["sentreminders"].upsert_entity.call_args.args[0]
+        assert entity["PartitionKey"] == "reminders"
+        assert entity["RowKey"] == "evt1"
+
+    def test_migrates_legacy_sent_flags(self, azure_storage, tables):
+        legacy = {
+            "reminder_sent_": [{"RowKey": "reminder_sent_evt1", "value": "true"}],
+            "pollwarn_sent_": [{"RowKey": "pollwarn_sent_p1", "value": "true"}],
+        }
+        tables["settings"].query_entities.side_effect = (
+            lambda query_filter, parameters: legacy[parameters["lo"]]
+        )
+        tables["polls"].query_entities.return_value = [
+            {"PartitionKey": "active", "RowKey": "0001_p1", "poll_id": "p1"},
+            {"PartitionKey": "active", "RowKey": "0002_p2", "poll_id": "p2"},
+        ]
+
+        azure_storage._migrate_sent_flags()
+
+        filters = [_odata_filter(c) for c in tables["settings"].query_entities.call_args_list]
+        assert filters == [
+            "PartitionKey eq 'settings' and RowKey ge 'reminder_sent_' "
+            "and RowKey lt 'reminder_sent`'",
+            "PartitionKey eq 'settings' and RowKey ge 'pollwarn_sent_' "
+            "and RowKey lt 'pollwarn_sent`'",
+        ]
+        reminder = tables["sentreminders"].upsert_entity.call_args.args[0]
+        assert (reminder["PartitionKey"], reminder["RowKey"]) == ("reminders", "evt1")
+        tables["polls"].update_entity.assert_called_once_with(
+            {"PartitionKey": "active", "RowKey": "0001_p1", "warning_sent": True}
+        )
+        assert [c.args for c in tables["settings"].delete_entity.call_args_list] == [
+            ("settings", "reminder_sent_evt1"),
+            ("settings", "pollwarn_sent_p1"),
+        ]
+
+    def test_migration_without_legacy_flags_writes_nothing(self, azure_storage, tables):
+        tables["settings"].query_entities.return_value = []
+
+        azure_storage._migrate_sent_flags()
+
+        tables["sentreminders"].upsert_entity.assert_not_called()
+        tables["polls"].query_entities.assert_not_called()
+        tables["settings"].delete_entity.assert_not_called()
+
+
+def make_poll(poll_id: str, created_at: datetime, closed: bool = False) -> PollRecord:
+    """Create a poll record closing two days after it was created."""
+    return PollRecord(
+        id=poll_id,
+        message_id=12345,
+        channel_id=67890,
+        created_at=created_at,
+        closes_at=created_at + timedelta(days=2),
+        closed=closed,
+    )
+
+
+class TestPollPartitions:
+    """Tests for the active/closed poll partitions and their migration."""
+
+    def test_newest_active_poll_sorts_first(self, azure_storage):
+        polls = [
+            make_poll("old", datetime(2024, 3, 1)),
+            make_poll("new", datetime(2024, 3, 15)),
+            make_poll("mid", datetime(2024, 3, 8, 12, 30)),
+        ]
+
+        keys = sorted(azure_storage._active_row_key(poll) for poll in polls)
+
+        assert [key.split("_", 1)[1] for key in keys] == ["new", "mid", "old"]
+
+    @pytest.mark.asyncio
+    async def test_get_active_poll_reads_first_active_row(self, azure_storage, tables):
+        poll = make_poll("p1", datetime(2024, 3, 15))
+        tables["polls"].query_entities.return_value = iter(
+            [azure_storage._poll_to_entity(poll)]
+        )
+
+        assert await azure_storage.get_active_poll() == poll
+        call = tables["polls"].query_entities.call_args
+        assert _odata_filter(call) == "PartitionKey eq 'active'"
+        assert call.kwargs["results_per_page"] == 1
+
+    def test_migrates_legacy_rows_then_deletes_them(self, azure_storage, tables):
+        poll = make_poll("p1", datetime(2024, 3, 15))
+        legacy = azure_storage._poll_to_entity(poll)
+        legacy.update(PartitionKey=LEGACY_POLLS, RowKey="p1")
+        del legacy["poll_id"]
+        current = azure_storage._poll_to_entity(make_poll("p2", datetime(2024, 3, 16)))
+        partitions = {LEGACY_POLLS: [legacy], ACTIVE_POLLS: [current]}
+        table = tables["polls"]
+        table.query_entities.side_effect = (
+            lambda query_filter, parameters: partitions[parameters["pk"]]
+        )
+
+        azure_storage._migrate_polls()
+
+        assert [c[0] for c in table.mock_calls if c[0] != "query_entities"] == [
+            "upsert_entity",
+            "delete_entity",
+        ]
+        table.upsert_entity.assert_called_once_with(azure_storage._poll_to_entity(poll))
+        table.delete_entity.assert_called_once_with(LEGACY_POLLS, "p1")
+
+    def test_migration_keeps_legacy_row_if_upsert_fails(self, azure_storage, tables):
+        legacy = azure_storage._poll_to_entity(make_poll("p1", datetime(2024, 3, 15)))
+        legacy.update(PartitionKey=LEGACY_POLLS, RowKey="p1")
+        del legacy["poll_id"]
+        table = tables["polls"]
+        table.query_entities.side_effect = (
+            lambda query_filter, parameters: [legacy] if parameters["pk"] == LEGACY_POLLS else []
+        )
+        table.upsert_entity.side_effect = RuntimeError("service unavailable")
+
+        with pytest.raises(RuntimeError):
+            azure_storage._migrate_polls()
+
+        table.delete_entity.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_closing_poll_moves_it_to_closed_partition(self, azure_storage, tables):
+        poll = make_poll("p1", datetime(2024, 3, 15))
+        active_key = azure_storage._active_row_key(poll)
+
+        poll.closed = True
+        poll.winning_date = datetime(2024, 3, 16)
+        await azure_storage.update_poll(poll)
+
+        entity = tables["polls"].upsert_entity.call_args.args[0]
+        assert (entity["PartitionKey"], entity["RowKey"]) == (CLOSED_POLLS, "p1")
+        tables["polls"].delete_entity.assert_called_once_with(ACTIVE_POLLS, active_key)
+
+        # Later updates to the closed poll stay in its partition
+        poll.created_event_id = "evt1"
+        await azure_storage.update_poll(poll)
+        tables["polls"].delete_entity.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_updating_open_poll_deletes_nothing(self, azure_storage, tables):
+        poll = make_poll("p1", datetime(2024, 3, 15))
+
+        poll.warning_sent = True
+        await azure_storage.update_poll(poll)
+
+        entity = tables["polls"].upsert_entity.call_args.args[0]
+        assert entity["PartitionKey"] == ACTIVE_POLLS
+        tables["polls"].delete_entity.assert_not_called()
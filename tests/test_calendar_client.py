@@ -1,8 +1,55 @@
 """Tests for calendar client and models."""
 
+import dataclasses
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
+import pytest
+
+from flumphbot.calendar.google_client import GoogleCalendarClient
 from flumphbot.calendar.models import CalendarEvent, EventStatus
+from flumphbot.config import GoogleConfig
+
+
+def _google_event(event_id: str) -> dict:
+    return {
+        "id": event_id,
+        "summary": f"Event {event_id}",
+        "start": {"dateTime": "2024-03-15T18:00:00Z"},
+        "end": {"dateTime": "2024-03-15T22:00:00Z"},
+    }
+
+
+@pytest.fixture
+def paged_client():
+    """Create a calendar client whose service returns two result pages."""
+    client = GoogleCalendarClient(GoogleConfig(credentials={}, calendar_id="cal"))
+    service = MagicMock()
+    service.events().list().execute.side_effect = [
+        {"items": [_google_event("1"), _google_event("2")], "nextPageToken": "next"},
+        {"items": [_google_event("3")]},
+    ]
+    client._get_service = MagicMock(return_value=service)
+    return client
+
+
+class TestGoogleCalendarClient:
+    """Tests for GoogleCalendarClient event fetching."""
+
+    def test_iter_events_follows_pages(self, paged_client):
+        events = list(paged_client.iter_events(page_size=2))
+        assert [e.id for e in events] == ["1", "2", "3"]
+
+    def test_get_events_respects_max_results(self, paged_client):
+        events = paged_client.get_events(max_results=2)
+        assert [e.id for e in events] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_get_events_async_follows_pages(self, paged_client):
+        events = await paged_client.get_events_async(
+            start_date=datetime(2024, 3, 15, 12, 0)
+        )
+        assert [e.id for e in events] == ["1", "2", "3"]
 
 
 class TestCalendarEvent:
@@ -43,6 +90,7 @@ class TestCalendarEvent:
         assert event.summary == "All Day Event"
         assert event.status == EventStatus.FREE
         assert event.all_day is True
+        assert event.duration_days == 1
 
     def test_from_google_event_utc(self):
         google_event = {
@@ -90,6 +138,32 @@ class TestCalendarEvent:
         assert "date" in google_event["start"]
         assert "date" in google_event["end"]
 
+    def test_is_immutable_and_hashable(self):
+        event = CalendarEvent(
+            id="test",
+            summary="Test Event",
+            start=datetime(2024, 3, 15, 18, 0),
+            end=datetime(2024, 3, 15, 22, 0),
+            status=EventStatus.BUSY,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.summary = "Changed"
+        assert event in {event}
+
+    def test_precomputes_lowercase_text(self):
+        event = CalendarEvent(
+            id="test",
+            summary="D&D Session",
+            start=datetime(2024, 3, 15, 18, 0),
+            end=datetime(2024, 3, 15, 22, 0),
+            status=EventStatus.BUSY,
+            description="Bring Dice",
+        )
+
+        assert event.summary_lower == "d&d session"
+        assert event.text_lower == "d&d session bring dice"
+
 
 class TestEventStatus:
     """Tests for EventStatus enum."""
@@ -226,6 +226,17 @@ class TestFindAvailableDates:
         for slot in available:
             assert slot.date.strftime("%A") == "Saturday"
 
+    def test_preferred_day_covers_every_week(self, analyzer):
+        monday = datetime(2024, 3, 11, 9, 30)
+        available = analyzer.find_available_dates(
+            [], monday, days_ahead=19, preferred_day="saturday"
+        )
+        assert [slot.date for slot in available] == [
+            datetime(2024, 3, 16),
+            datetime(2024, 3, 23),
+            datetime(2024, 3, 30),
+        ]
+
 
 class TestFindAwayEvents:
     """Tests for away event detection."""
@@ -321,6 +332,45 @@ class TestGetCategory:
         assert analyzer.get_category(event) == EventCategory.DND
 
 
+class TestClassifyAll:
+    """Tests for single-pass event classification."""
+
+    def test_matches_individual_analyses(self, analyzer, sample_events):
+        now = datetime.utcnow()
+        classified = analyzer.classify_all(sample_events, start_date=now, days_ahead=14)
+
+        assert classified.needs_fix == analyzer.find_events_needing_fix(sample_events)
+        assert classified.personal == analyzer.find_personal_events(sample_events)
+        assert classified.away == analyzer.find_away_events(sample_events)
+        assert classified.available_dates == analyzer.find_available_dates(
+            sample_events, now, days_ahead=14
+        )
+
+    def test_no_start_date_skips_availability(self, analyzer, sample_events):
+        classified = analyzer.classify_all(sample_events)
+        assert classified.available_dates == []
+
+    def test_records_category_per_event(self, analyzer, sample_events):
+        classified = analyzer.classify_all(sample_events)
+        assert classified.categories == {
+            event.id: analyzer.get_category(event) for event in sample_events
+        }
+
+    def test_personal_false_skips_keyword_detection(self, analyzer, sample_events):
+        now = datetime.utcnow()
+        classified = analyzer.classify_all(
+            sample_events, start_date=now, days_ahead=14, personal=False
+        )
+
+        assert classified.personal == []
+        assert classified.categories == {}
+        assert classified.needs_fix == analyzer.find_events_needing_fix(sample_events)
+        assert classified.away == analyzer.find_away_events(sample_events)
+        assert classified.available_dates == analyzer.find_available_dates(
+            sample_events, now, days_ahead=14
+        )
+
+
 class TestFindVacationEvents:
     """Tests for vacation detection (deprecated, uses find_away_events)."""
 
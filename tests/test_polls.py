@@ -7,7 +7,7 @@ import pytest
 
 from flumphbot.bot.polls import PollManager
 from flumphbot.calendar.models import AvailabilitySlot, EventStatus
-from flumphbot.storage.base import PollRecord
+from flumphbot.storage.base import PollOption, PollRecord
 
 
 @pytest.fixture
@@ -94,6 +94,7 @@ class TestPollManager:
     async def test_get_active_poll_returns_none(self, poll_manager):
         result = await poll_manager.get_active_poll()
         assert result is None
+        assert poll_manager.has_active_poll is False
 
     @pytest.mark.asyncio
     async def test_get_active_poll_returns_poll(self, poll_manager, mock_storage):
@@ -108,3 +109,70 @@ class TestPollManager:
 
         result = await poll_manager.get_active_poll()
         assert result == expected
+        assert poll_manager.has_active_poll is True
+
+    def test_active_poll_state_unknown_initially(self, poll_manager):
+        assert poll_manager.has_active_poll is None
+
+    @pytest.mark.asyncio
+    async def test_create_poll_notifies_callback(self, mock_storage):
+        created = []
+        manager = PollManager(mock_storage, on_poll_created=created.append)
+        channel = MagicMock()
+        channel.send = AsyncMock(return_value=MagicMock(id=111))
+        channel.id = 222
+
+        await manager.create_scheduling_poll(
+            channel, [AvailabilitySlot(date=datetime(2024, 3, 16))], duration_hours=24
+        )
+
+        assert len(created) == 1
+        assert created[0].message_id == 111
+        assert created[0].closes_at - created[0].created_at == timedelta(hours=24)
+        assert manager.has_active_poll is True
+
+
+class TestClosePoll:
+    """Tests for closing a poll and picking a winner."""
+
+    @pytest.mark.asyncio
+    async def test_records_tallies_and_winner(self, poll_manager, mock_storage):
+        poll = PollRecord(
+            id="test-id",
+            message_id=12345,
+            channel_id=67890,
+            created_at=datetime.utcnow(),
+            closes_at=datetime.utcnow(),
+        )
+        dates = [datetime(2024, 3, 16), datetime(2024, 3, 17)]
+        mock_storage.get_poll_options.return_value = [
+            PollOption(poll_id="test-id", date=d) for d in dates
+        ]
+        message = MagicMock()
+        message.poll.answers = [MagicMock(vote_count=1), MagicMock(vote_count=3)]
+
+        winner = await poll_manager.close_poll_and_get_winner(poll, message)
+
+        assert winner == dates[1]
+        assert poll.closed is True
+        mock_storage.bulk_update_option_votes.assert_awaited_once_with(
+            "test-id", [(dates[0], 1), (dates[1], 3)]
+        )
+        assert poll_manager.has_active_poll is False
+
+    @pytest.mark.asyncio
+    async def test_close_poll_without_winner(self, poll_manager, mock_storage):
+        poll = PollRecord(
+            id="test-id",
+            message_id=12345,
+            channel_id=67890,
+            created_at=datetime.utcnow(),
+            closes_at=datetime.utcnow(),
+        )
+
+        await poll_manager.close_poll(poll)
+
+        assert poll.closed is True
+        assert poll.winning_date is None
+        mock_storage.update_poll.assert_awaited_once_with(poll)
+        assert poll_manager.has_active_poll is False
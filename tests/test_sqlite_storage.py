@@ -0,0 +1,314 @@
+"""Tests for the SQLite storage backend."""
+
+import sqlite3
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+from flumphbot.storage import sqlite as sqlite_module
+from flumphbot.storage.base import PollOption, PollRecord, UserMapping
+from flumphbot.storage.sqlite import SQLiteStorage
+
+
+@pytest.fixture
+async def sqlite_storage():
+    """Create an initialized SQLite storage on a shared-cache memory database."""
+    storage = SQLiteStorage("file::memory:?cache=shared")
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+def make_poll(poll_id: str, created_at: datetime, closed: bool = False) -> PollRecord:
+    """Create a poll record closing two days after it was created."""
+    return PollRecord(
+        id=poll_id,
+        message_id=12345,
+        channel_id=67890,
+        created_at=created_at,
+        closes_at=created_at + timedelta(days=2),
+        closed=closed,
+    )
+
+
+class TestUserMappings:
+    """Tests for user mapping storage."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, sqlite_storage):
+        created = datetime(2024, 3, 15, 18, 30, 5, 123456)
+        await sqlite_storage.set_user_mapping(UserMapping(1, "alice", "a@x.com", created))
+
+        mapping = await sqlite_storage.get_user_mapping(1)
+        assert mapping == UserMapping(1, "alice", "a@x.com", created)
+
+    @pytest.mark.asyncio
+    async def test_relink_keeps_created_at(self, sqlite_storage):
+        created = datetime(2024, 3, 15)
+        await sqlite_storage.set_user_mapping(UserMapping(1, "alice", "a@x.com", created))
+        await sqlite_storage.set_user_mapping(
+            UserMapping(1, "alice2", "b@x.com", datetime(2024, 4, 1))
+        )
+
+        mapping = await sqlite_storage.get_user_mapping(1)
+        assert mapping.calendar_email == "b@x.com"
+        assert mapping.created_at == created
+
+    @pytest.mark.asyncio
+    async def test_delete(self, sqlite_storage):
+        await sqlite_storage.set_user_mapping(
+            UserMapping(1, "alice", "a@x.com", datetime(2024, 3, 15))
+        )
+        await sqlite_storage.delete_user_mapping(1)
+        assert await sqlite_storage.get_user_mapping(1) is None
+        assert await sqlite_storage.get_all_user_mappings() == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_skips_unmapped(self, sqlite_storage):
+        for discord_id in (1, 2):
+            await sqlite_storage.set_user_mapping(
+                UserMapping(discord_id, f"user{discord_id}", "a@x.com", datetime(2024, 3, 15))
+            )
+
+        mappings = await sqlite_storage.get_user_mappings_bulk([2, 3])
+        assert list(mappings) == [2]
+
+
+class TestPolls:
+    """Tests for poll storage."""
+
+    @pytest.mark.asyncio
+    async def test_active_poll_is_newest_open(self, sqlite_storage):
+        start = datetime(2024, 3, 15)
+        await sqlite_storage.create_poll(make_poll("old", start), [])
+        await sqlite_storage.create_poll(make_poll("new", start + timedelta(days=1)), [])
+        await sqlite_storage.create_poll(
+            make_poll("closed", start + timedelta(days=2), closed=True), []
+        )
+
+        active = await sqlite_storage.get_active_poll()
+        assert active.id == "new"
+
+    @pytest.mark.asyncio
+    async def test_update_poll(self, sqlite_storage):
+        poll = make_poll("p", datetime(2024, 3, 15))
+        await sqlite_storage.create_poll(poll, [])
+
+        poll.closed = True
+        poll.warning_sent = True
+        poll.winning_date = datetime(2024, 3, 16)
+        await sqlite_storage.update_poll(poll)
+
+        assert await sqlite_storage.get_poll("p") == poll
+        assert await sqlite_storage.get_active_poll() is None
+
+    @pytest.mark.asyncio
+    async def test_failed_create_leaves_nothing(self, sqlite_storage):
+        date = datetime(2024, 3, 16)
+        duplicate = [PollOption("p", date), PollOption("p", date)]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await sqlite_storage.create_poll(make_poll("p", datetime(2024, 3, 15)), duplicate)
+
+        assert await sqlite_storage.get_poll("p") is None
+
+    @pytest.mark.asyncio
+    async def test_poll_with_options(self, sqlite_storage):
+        poll = make_poll("p", datetime(2024, 3, 15))
+        dates = [datetime(2024, 3, 17), datetime(2024, 3, 16)]
+        await sqlite_storage.create_poll(poll, [PollOption("p", d) for d in dates])
+        await sqlite_storage.bulk_update_option_votes("p", [(dates[0], 4)])
+
+        result = await sqlite_storage.get_poll_with_options("p")
+        assert result is not None
+        stored, options = result
+        assert stored == poll
+        assert [(o.date, o.vote_count) for o in options] == [(dates[1], 0), (dates[0], 4)]
+
+    @pytest.mark.asyncio
+    async def test_poll_with_options_missing(self, sqlite_storage):
+        assert await sqlite_storage.get_poll_with_options("missing") is None
+
+
+class TestSettingsAndReminders:
+    """Tests for settings, keywords and reminder bookkeeping."""
+
+    @pytest.mark.asyncio
+    async def test_settings_bulk(self, sqlite_storage):
+        await sqlite_storage.set_setting("pollwarn_hours", "12")
+        await sqlite_storage.set_setting("pollwarn_hours", "24")
+
+        settings = await sqlite_storage.get_settings_bulk(["pollwarn_hours", "unset"])
+        assert settings == {"pollwarn_hours": "24"}
+
+    @pytest.mark.asyncio
+    async def test_sent_reminders(self, sqlite_storage):
+        await sqlite_storage.mark_reminder_sent("s1")
+        assert await sqlite_storage.get_sent_reminders(["s1", "s2"]) == {"s1"}
+
+    @pytest.mark.asyncio
+    async def test_keywords(self, sqlite_storage):
+        assert await sqlite_storage.get_keywords("dnd") is None
+        await sqlite_storage.set_keywords("dnd", ["d&d", "campaign"])
+        assert await sqlite_storage.get_keywords("dnd") == ["d&d", "campaign"]
+
+
+@pytest.fixture
+async def file_storage(tmp_path):
+    """Create an initialized SQLite storage with separate reader connections."""
+    storage = SQLiteStorage(str(tmp_path / "flumph.db"))
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+def write_during_read(storage: SQLiteStorage, write) -> None:
+    """Make the next read finish only after ``write`` has committed."""
+    acquire_read = storage._acquire_read
+
+    @asynccontextmanager
+    async def racing_read():
+        storage._acquire_read = acquire_read
+        async with acquire_read() as conn:
+            yield conn
+        await write()
+
+    storage._acquire_read = racing_read
+
+
+class TestCacheConsistency:
+    """Tests that reads overlapping a write never cache the stale value."""
+
+    @pytest.mark.asyncio
+    async def test_setting_read_does_not_overwrite_newer_write(self, file_storage):
+        await file_storage.set_setting("schedule_day", "Friday")
+        file_storage._settings_cache.clear()
+        write_during_read(
+            file_storage, lambda: file_storage.set_setting("schedule_day", "Sunday")
+        )
+
+        await file_storage.get_setting("schedule_day")
+
+        assert await file_storage.get_setting("schedule_day") == "Sunday"
+
+    @pytest.mark.asyncio
+    async def test_bulk_read_does_not_overwrite_newer_write(self, file_storage):
+        write_during_read(
+            file_storage, lambda: file_storage.set_setting("schedule_day", "Sunday")
+        )
+
+        await file_storage.get_settings_bulk(["schedule_day"])
+
+        assert await file_storage.get_settings_bulk(["schedule_day"]) == {
+            "schedule_day": "Sunday"
+        }
+
+    @pytest.mark.asyncio
+    async def test_user_read_overlapping_write_is_not_cached(self, file_storage):
+        mapping = UserMapping(1, "alice", "a@x.com", datetime(2024, 3, 15))
+        write_during_read(file_storage, lambda: file_storage.set_user_mapping(mapping))
+
+        assert await file_storage.get_user_mapping(1) is None
+
+        assert await file_storage.get_user_mapping(1) == mapping
+
+    @pytest.mark.asyncio
+    async def test_user_mapping_expires(self, file_storage, monkeypatch):
+        mapping = UserMapping(1, "alice", "a@x.com", datetime(2024, 3, 15))
+        await file_storage.set_user_mapping(mapping)
+        await file_storage.get_user_mapping(1)
+
+        # Another tool removes the mapping behind the bot's back
+        async with file_storage._acquire_write() as conn:
+            await conn.execute("DELETE FROM user_mappings")
+            await conn.commit()
+        assert await file_storage.get_user_mapping(1) is not None
+
+        monkeypatch.setattr(sqlite_module, "USER_CACHE_TTL", 0.0)
+        assert await file_storage.get_user_mapping(1) is None
+
+
+class TestMigration:
+    """Tests for upgrading databases that stored ISO text timestamps."""
+
+    @pytest.mark.asyncio
+    async def test_converts_text_timestamps(self, tmp_path):
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE polls (
+                id TEXT PRIMARY KEY,
+                message_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                closes_at TEXT NOT NULL,
+                closed INTEGER DEFAULT 0,
+                winning_date TEXT,
+                created_event_id TEXT
+            );
+            INSERT INTO polls VALUES
+                ('p', 1, 2, '2024-03-15T18:00:00', '2024-03-17T18:00:00', 0, NULL, NULL);
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        storage = SQLiteStorage(str(path))
+        await storage.initialize()
+        try:
+            poll = await storage.get_active_poll()
+        finally:
+            await storage.close()
+
+        assert poll == PollRecord(
+            id="p",
+            message_id=1,
+            channel_id=2,
+            created_at=datetime(2024, 3, 15, 18),
+            closes_at=datetime(2024, 3, 17, 18),
+        )
+
+    @pytest.mark.asyncio
+    async def test_imports_legacy_sent_flags(self, tmp_path):
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE polls (
+                id TEXT PRIMARY KEY,
+                message_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                closes_at TEXT NOT NULL,
+                closed INTEGER DEFAULT 0,
+                winning_date TEXT,
+                created_event_id TEXT
+            );
+            CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            INSERT INTO polls VALUES
+                ('p', 1, 2, '2024-03-15T18:00:00', '2024-03-17T18:00:00', 0, NULL, NULL);
+            INSERT INTO settings VALUES
+                ('pollwarn_sent_p', 'true'),
+                ('reminder_sent_evt1', 'true'),
+                ('schedule_day', 'Friday');
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        storage = SQLiteStorage(str(path))
+        await storage.initialize()
+        try:
+            poll = await storage.get_active_poll()
+            sent = await storage.get_sent_reminders(["evt1", "evt2"])
+            leftover = await storage.get_settings_bulk(
+                ["pollwarn_sent_p", "reminder_sent_evt1", "schedule_day"]
+            )
+        finally:
+            await storage.close()
+
+        assert poll is not None and poll.warning_sent
+        assert sent == {"evt1"}
+        assert leftover == {"schedule_day": "Friday"}
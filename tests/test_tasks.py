@@ -0,0 +1,262 @@
+"""Tests for scheduled tasks."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from flumphbot.bot.client import FlumphBot
+from flumphbot.scheduler import tasks
+from flumphbot.scheduler.tasks import (
+    DISCORD_MESSAGE_LIMIT,
+    POLL_COMPLETION_RETRY,
+    RATE_LIMIT_BACKOFF,
+    ScheduledTasks,
+    _back_off,
+    _first_rate_limit,
+    _rate_limit_delay,
+    _split_message,
+)
+from flumphbot.storage.base import PollRecord
+
+NOW = datetime(2024, 3, 15, 12, 0)
+
+
+def _poll(closes_at: datetime) -> PollRecord:
+    return PollRecord(
+        id="poll1",
+        message_id=10,
+        channel_id=20,
+        created_at=closes_at - timedelta(hours=48),
+        closes_at=closes_at,
+    )
+
+
+class AzureStyleError(Exception):
+    """Error shaped like Azure's HttpResponseError."""
+
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = MagicMock(headers=headers or {})
+
+
+def _discord_error(status: int, headers: dict | None = None) -> discord.HTTPException:
+    return discord.HTTPException(
+        MagicMock(status=status, headers=headers or {}), "error"
+    )
+
+
+@pytest.fixture
+def mock_bot(monkeypatch):
+    """Create a mock bot with an open poll and a fixed clock."""
+    monkeypatch.setattr(tasks, "_utcnow", lambda: NOW)
+    bot = MagicMock()
+    bot.poll_manager.has_active_poll = None
+    bot.poll_manager.get_active_poll = AsyncMock(
+        return_value=_poll(NOW - timedelta(hours=1))
+    )
+    bot.poll_manager.close_poll_and_get_winner = AsyncMock(return_value=None)
+    bot.poll_manager.close_poll = AsyncMock(side_effect=_close)
+    bot.calendar_client.create_event_async = AsyncMock()
+    bot.storage.update_poll = AsyncMock()
+    bot.send_notification = AsyncMock()
+    return bot
+
+
+def _close(poll: PollRecord) -> None:
+    poll.closed = True
+
+
+def _text_channel() -> MagicMock:
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.fetch_message = AsyncMock()
+    return channel
+
+
+class TestSplitMessage:
+    """Tests for splitting digests at Discord's message limit."""
+
+    def test_exactly_at_limit_stays_one_message(self):
+        header = "Fixed:"
+        line = "x" * (DISCORD_MESSAGE_LIMIT - len(header) - 1)
+
+        messages = _split_message(header, [line])
+
+        assert messages == [f"{header}\n{line}"]
+        assert len(messages[0]) == DISCORD_MESSAGE_LIMIT
+
+    def test_splits_across_several_messages(self):
+        lines = [f"- event {i:03d}" for i in range(300)]
+
+        messages = _split_message("Fixed:", lines)
+
+        assert len(messages) > 1
+        assert all(len(m) <= DISCORD_MESSAGE_LIMIT for m in messages)
+        assert all(m.startswith("Fixed:\n") for m in messages)
+        assert [line for m in messages for line in m.split("\n")[1:]] == lines
+
+    def test_truncates_line_longer_than_limit(self):
+        messages = _split_message("Fixed:", ["a", "y" * 3000, "b"])
+
+        assert len(messages) == 3
+        assert all(len(m) <= DISCORD_MESSAGE_LIMIT for m in messages)
+        assert len(messages[1]) == DISCORD_MESSAGE_LIMIT
+        assert messages[2] == "Fixed:\nb"
+
+
+class TestRateLimitHelpers:
+    """Tests for detecting and backing off from rate limits."""
+
+    def test_rate_limited_uses_retry_after(self):
+        assert _rate_limit_delay(discord.RateLimited(12.5)) == 12.5
+
+    def test_discord_429_reads_retry_after_header(self):
+        error = _discord_error(429, {"Retry-After": "3"})
+        assert _rate_limit_delay(error) == 3.0
+
+    def test_status_code_429_reads_retry_after_header(self):
+        error = AzureStyleError(429, {"Retry-After": "7"})
+        assert _rate_limit_delay(error) == 7.0
+
+    def test_429_without_hint_uses_default(self):
+        assert _rate_limit_delay(AzureStyleError(429)) == RATE_LIMIT_BACKOFF
+
+    def test_unparseable_retry_after_uses_default(self):
+        error = _discord_error(429, {"Retry-After": "soon"})
+        assert _rate_limit_delay(error) == RATE_LIMIT_BACKOFF
+
+    def test_other_errors_are_not_rate_limits(self):
+        assert _rate_limit_delay(_discord_error(500)) is None
+        assert _rate_limit_delay(AzureStyleError(404)) is None
+        assert _rate_limit_delay(ValueError("bad")) is None
+
+    def test_first_rate_limit_picks_first_match(self):
+        first = AzureStyleError(429)
+        results = [None, ValueError("bad"), first, discord.RateLimited(1.0)]
+        assert _first_rate_limit(results) is first
+
+    def test_first_rate_limit_none_without_match(self):
+        assert _first_rate_limit([None, ValueError("bad"), _discord_error(500)]) is None
+
+    @pytest.mark.asyncio
+    async def test_back_off_sleeps_for_rate_limit(self, monkeypatch):
+        sleep = AsyncMock()
+        monkeypatch.setattr(tasks.asyncio, "sleep", sleep)
+
+        assert await _back_off(discord.RateLimited(2.0), "test task") is True
+        sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_back_off_ignores_other_errors(self, monkeypatch):
+        sleep = AsyncMock()
+        monkeypatch.setattr(tasks.asyncio, "sleep", sleep)
+
+        assert await _back_off(ValueError("bad"), "test task") is False
+        sleep.assert_not_awaited()
+
+
+class TestCheckPollCompletion:
+    """Tests for the one-shot poll completion check."""
+
+    @pytest.mark.asyncio
+    async def test_overdue_poll_rearms_while_channel_unavailable(self, mock_bot):
+        # At startup the gateway may not have delivered the channel yet
+        mock_bot.get_channel.return_value = None
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        mock_bot.poll_manager.close_poll_and_get_winner.assert_not_awaited()
+        mock_bot.schedule_poll_completion.assert_called_once_with(
+            NOW + POLL_COMPLETION_RETRY
+        )
+
+    @pytest.mark.asyncio
+    async def test_open_poll_rearms_at_close_time(self, mock_bot):
+        closes_at = NOW + timedelta(hours=2)
+        mock_bot.poll_manager.get_active_poll.return_value = _poll(closes_at)
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        mock_bot.schedule_poll_completion.assert_called_once_with(closes_at)
+
+    @pytest.mark.asyncio
+    async def test_rearms_after_error(self, mock_bot):
+        mock_bot.poll_manager.get_active_poll.side_effect = RuntimeError("boom")
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        mock_bot.schedule_poll_completion.assert_called_once_with(
+            NOW + POLL_COMPLETION_RETRY
+        )
+
+    @pytest.mark.asyncio
+    async def test_poll_with_winner_is_closed_and_not_rearmed(self, mock_bot):
+        winner = datetime(2024, 3, 16, 18, 0)
+
+        async def close_with_winner(poll, message):
+            poll.closed = True
+            return winner
+
+        mock_bot.poll_manager.close_poll_and_get_winner.side_effect = close_with_winner
+        mock_bot.get_channel.return_value = _text_channel()
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        mock_bot.calendar_client.create_event_async.assert_awaited_once()
+        mock_bot.poll_manager.close_poll.assert_not_awaited()
+        mock_bot.schedule_poll_completion.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_without_votes_is_closed_and_not_rearmed(self, mock_bot):
+        mock_bot.get_channel.return_value = _text_channel()
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        poll = mock_bot.poll_manager.close_poll.await_args.args[0]
+        assert poll.closed is True
+        mock_bot.calendar_client.create_event_async.assert_not_awaited()
+        mock_bot.send_notification.assert_awaited_once()
+        mock_bot.schedule_poll_completion.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rearms_if_poll_stays_open(self, mock_bot):
+        mock_bot.poll_manager.close_poll.side_effect = None
+        mock_bot.get_channel.return_value = _text_channel()
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        mock_bot.schedule_poll_completion.assert_called_once_with(
+            NOW + POLL_COMPLETION_RETRY
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_text_channel_is_not_rearmed(self, mock_bot):
+        mock_bot.get_channel.return_value = MagicMock(spec=discord.VoiceChannel)
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        mock_bot.poll_manager.close_poll_and_get_winner.assert_not_awaited()
+        mock_bot.schedule_poll_completion.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_open_poll_is_not_rearmed(self, mock_bot):
+        mock_bot.poll_manager.get_active_poll.return_value = None
+
+        await ScheduledTasks(mock_bot).check_poll_completion()
+
+        mock_bot.schedule_poll_completion.assert_not_called()
+
+
+class TestStartupPollCompletion:
+    """Tests for picking up an open poll when the bot connects."""
+
+    @pytest.mark.asyncio
+    async def test_on_ready_schedules_open_poll(self, mock_bot):
+        closes_at = NOW - timedelta(hours=1)
+        mock_bot.change_presence = AsyncMock()
+
+        await FlumphBot.on_ready(mock_bot)
+
+        mock_bot.schedule_poll_completion.assert_called_once_with(closes_at)